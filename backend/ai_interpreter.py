@@ -3,31 +3,261 @@ AI Interpreter Module
 Handles natural language command interpretation using Google Gemini AI.
 """
 
+import asyncio
 import os
 import json
 import re
+import shlex
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
 from typing import Dict, List, Any, Optional
 from dotenv import load_dotenv
-import google.generativeai as genai
 
 # Load environment variables
 load_dotenv()
 
+@dataclass(slots=True)
+class InterpretResult:
+    """
+    Result of a natural language interpretation.
+
+    A slotted dataclass is cheaper to allocate than a fresh dict per call
+    and fixes the result shape. Dict-style access (result['success'],
+    result.get('error')) is supported so existing callers are unaffected.
+    """
+    success: bool
+    command: Optional[str] = None
+    error: Optional[str] = None
+    original_input: Optional[str] = None
+    confidence: Optional[float] = None
+
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict view for JSON serialization."""
+        return asdict(self)
+
+# Precompiled security/confidence patterns (compiled once at import to keep
+# them off the per-request hot path)
+_DANGEROUS_INPUT_RE = re.compile(
+    r'delete\s+everything|format\s+disk|wipe\s+system|remove\s+all|'
+    r'destroy\s+|hack\s+|password\s+|sudo\s+|root\s+access|'
+    r'system\s+shutdown|kill\s+all|format\s+drive'
+)
+
+# Commands the AI is allowed to generate. Interned so membership checks on
+# interned candidates can short-circuit on pointer identity.
+_ALLOWED_COMMANDS = frozenset(sys.intern(c) for c in (
+    'ls', 'pwd', 'cd', 'mkdir', 'rmdir', 'rm', 'cp', 'mv', 'touch',
+    'cat', 'head', 'tail', 'find', 'stat', 'echo', 'grep', 'wc',
+    'sort', 'diff', 'ps', 'uptime', 'date', 'env', 'system',
+    'help', 'clear', 'history'
+))
+
+# Fixed-string dangers checked with plain substring scans, which are much
+# cheaper than regex searches. A lone backtick is rejected outright: no
+# allowed command legitimately contains one.
+_DANGEROUS_SUBSTRINGS = ('/dev/null', '2>&1', '$(', '`')
+
+# Remaining dangers that need quantifiers; named groups let the validator
+# report which pattern matched while still scanning in a single pass
+_DANGEROUS_CMD_PATTERNS = {
+    'rm_rf_root': r'rm\s+-rf\s+/',
+    'rm_rf_star': r'rm\s+-rf\s+\*',
+    'sudo': r'sudo\s+',
+    'su': r'su\s+',
+    'chmod_777': r'chmod\s+777',
+    'background': r'&\s*$',
+    'pipe_sh': r'\|\s*sh',
+    'dev_redirect': r'>\s*/dev/',
+    'pipe_bash': r'\|\s*bash',
+}
+_DANGEROUS_CMD_RE = re.compile(
+    '|'.join(f'(?P<{name}>{pattern})' for name, pattern in _DANGEROUS_CMD_PATTERNS.items())
+)
+
+# Parses "Output N: <command>" lines in batched Gemini responses
+_BATCH_OUTPUT_RE = re.compile(r'Output\s+(\d+):\s*(.+)')
+
+# Collapses runs of whitespace when normalizing cache keys
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Caps concurrent in-flight Gemini calls on the async paths; overflow
+# awaits here (backpressure) instead of piling requests onto the API.
+# A semaphore binds to the loop that first awaits it, and this app's
+# async entry points each run their own loop via asyncio.run(), so one
+# is created lazily per running loop rather than at import. Finished
+# loops fall out of the map through the weak keys.
+_GEMINI_CONCURRENCY = 32
+_gemini_semaphores: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+def _gemini_semaphore() -> asyncio.Semaphore:
+    """Return the concurrency cap for the current running loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _gemini_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _gemini_semaphores[loop] = asyncio.Semaphore(_GEMINI_CONCURRENCY)
+    return semaphore
+
+_CLEAR_PATTERNS_RE = tuple((re.compile(p), frozenset(cmds), boost) for p, cmds, boost in [
+    (r'list\s+(files|directory|contents)', ['ls'], 0.3),
+    (r'show\s+(files|directory)', ['ls'], 0.3),
+    (r'create\s+(folder|directory)', ['mkdir'], 0.3),
+    (r'make\s+(folder|directory)', ['mkdir'], 0.3),
+    (r'copy\s+\w+\s+to\s+\w+', ['cp'], 0.3),
+    (r'move\s+\w+\s+to\s+\w+', ['mv'], 0.3),
+    (r'show\s+(contents?|text)\s+of', ['cat'], 0.3),
+    (r'display\s+(contents?|text)', ['cat'], 0.3),
+    (r'current\s+directory', ['pwd'], 0.3),
+    (r'where\s+am\s+i', ['pwd'], 0.3),
+    (r'system\s+(info|information)', ['system'], 0.3),
+    (r'help|commands', ['help'], 0.3)
+])
+
+# Deterministic fast paths: inputs that map unambiguously to a command are
+# answered locally, skipping the Gemini round-trip entirely. Patterns must
+# fullmatch the lowercased, stripped input so anything with extra context
+# still falls through to the model.
+_FAST_PATHS = tuple((re.compile(p), fn) for p, fn in [
+    (r'(?:show\s+(?:me\s+)?(?:the\s+)?)?current\s+(?:directory|folder|location)',
+     lambda m: 'pwd'),
+    (r'where\s+am\s+i\??',
+     lambda m: 'pwd'),
+    (r'(?:list|show)(?:\s+me)?(?:\s+all)?(?:\s+the)?\s+files'
+     r'(?:\s+in(?:\s+the)?\s+current\s+(?:directory|folder))?',
+     lambda m: 'ls -la'),
+    (r'(?:create|make)\s+(?:a\s+)?(?:new\s+)?(?:folder|directory)\s+'
+     r'(?:called|named)\s+([\w.-]+)',
+     lambda m: f'mkdir {m.group(1)}'),
+    (r'(?:show\s+)?system\s+(?:info|information|status)',
+     lambda m: 'system'),
+    (r'(?:show\s+)?(?:available\s+)?commands|(?:show\s+)?help(?:\s+me)?',
+     lambda m: 'help'),
+    (r'clear(?:\s+the)?\s+(?:screen|terminal)',
+     lambda m: 'clear'),
+    (r'(?:show\s+(?:the\s+)?)?command\s+history',
+     lambda m: 'history'),
+])
+
+# Suggestion table for get_command_suggestions, hoisted to module level
+_SUGGESTION_PATTERNS = (
+    {
+        'keywords': ['list', 'show', 'display', 'files', 'directory'],
+        'command': 'ls',
+        'description': 'List directory contents',
+        'examples': ['ls', 'ls -la', 'ls /path/to/directory']
+    },
+    {
+        'keywords': ['create', 'make', 'folder', 'directory'],
+        'command': 'mkdir',
+        'description': 'Create directory',
+        'examples': ['mkdir foldername', 'mkdir -p path/to/folder']
+    },
+    {
+        'keywords': ['copy', 'duplicate'],
+        'command': 'cp',
+        'description': 'Copy files or directories',
+        'examples': ['cp source.txt dest.txt', 'cp -r folder1 folder2']
+    },
+    {
+        'keywords': ['move', 'rename'],
+        'command': 'mv',
+        'description': 'Move or rename files',
+        'examples': ['mv old.txt new.txt', 'mv file.txt /path/to/']
+    },
+    {
+        'keywords': ['remove', 'delete'],
+        'command': 'rm',
+        'description': 'Remove files or directories',
+        'examples': ['rm file.txt', 'rm -r directory']
+    },
+    {
+        'keywords': ['content', 'read', 'text'],
+        'command': 'cat',
+        'description': 'Display file contents',
+        'examples': ['cat file.txt', 'cat *.txt']
+    },
+    {
+        'keywords': ['where', 'current', 'location'],
+        'command': 'pwd',
+        'description': 'Show current directory',
+        'examples': ['pwd']
+    },
+    {
+        'keywords': ['system', 'monitor', 'performance'],
+        'command': 'system',
+        'description': 'Show system information',
+        'examples': ['system']
+    }
+)
+
+# Multi-keyword matcher: one alternation of every suggestion keyword
+# (longest first so overlapping literals resolve consistently) plus a map
+# from keyword back to the pattern indices that use it. One scan of the
+# input finds all keyword hits instead of one substring test per keyword.
+_SUGGESTION_KEYWORD_INDEX: Dict[str, List[int]] = {}
+for _index, _pattern in enumerate(_SUGGESTION_PATTERNS):
+    for _keyword in _pattern['keywords']:
+        _SUGGESTION_KEYWORD_INDEX.setdefault(_keyword, []).append(_index)
+_SUGGESTION_KEYWORD_RE = re.compile(
+    '|'.join(re.escape(k) for k in sorted(_SUGGESTION_KEYWORD_INDEX, key=len, reverse=True))
+)
+
 class AIInterpreter:
     """
     Interprets natural language commands using Google Gemini AI.
     """
     
     def __init__(self):
+        # Imported here rather than at module top: pulling in grpc/protobuf/
+        # google-auth costs seconds of worker cold start, and callers that
+        # never construct an interpreter shouldn't pay it
+        import google.generativeai as genai
+
         # Initialize Gemini AI
         self.api_key = os.environ.get('GEMINI_API_KEY')
         if not self.api_key:
             raise ValueError("GEMINI_API_KEY must be set in environment variables")
         
-        genai.configure(api_key=self.api_key)
+        # Pin the gRPC transport explicitly: the channel is created once and
+        # kept alive across calls, so repeated requests reuse one TCP+TLS
+        # connection instead of paying a handshake per call
+        genai.configure(api_key=self.api_key, transport='grpc')
         
         # Initialize the model with the correct model name
         self.model = genai.GenerativeModel('gemini-2.5-flash')
+
+        # Per-request timeout so a stalled Gemini call can't hang a worker
+        # indefinitely; the SDK reuses one persistent channel across calls
+        self.request_options = {'timeout': 30}
+
+        # Generation configs: commands are short, single-line, and
+        # deterministic, so cap output tokens and disable sampling; the
+        # decode loop then runs a few dozen steps instead of thousands.
+        # Explanations and batched outputs get larger caps.
+        self._command_gen_config = genai.types.GenerationConfig(
+            max_output_tokens=64, temperature=0.0, candidate_count=1, stop_sequences=['\n']
+        )
+        self._batch_gen_config = genai.types.GenerationConfig(
+            max_output_tokens=512, temperature=0.0, candidate_count=1
+        )
+        self._explain_gen_config = genai.types.GenerationConfig(
+            max_output_tokens=256, temperature=0.0, candidate_count=1
+        )
+
+        # LRU caches for repeated inputs: a hit skips the Gemini round-trip
+        # entirely. Guarded by a lock for multithreaded SocketIO handlers.
+        self._cache_maxsize = 1024
+        self._interpret_cache: OrderedDict = OrderedDict()
+        self._explain_cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
         
         # Define the system prompt for command interpretation
         self.system_prompt = """You are a helpful assistant that converts natural language instructions into Linux/Unix terminal commands. 
@@ -76,8 +306,15 @@ Output: system
 Input: "delete everything on the system"
 Output: ERROR: Destructive operation not allowed
 """
-    
-    def interpret(self, natural_language_input: str) -> Dict[str, Any]:
+
+        # Prompt skeleton built once; per-call prompt assembly is then a
+        # single concatenation instead of re-copying the ~1.5KB system
+        # prompt through an f-string
+        self._prompt_prefix = self.system_prompt + "\n\nInput: "
+        self._prompt_suffix = "\nOutput:"
+
+
+    def interpret(self, natural_language_input: str) -> InterpretResult:
         """
         Interpret natural language input and convert to terminal command.
         
@@ -88,96 +325,322 @@ Output: ERROR: Destructive operation not allowed
             Dict containing interpretation results
         """
         try:
-            # Validate input
-            if not natural_language_input.strip():
-                return {
-                    'success': False,
-                    'error': 'Empty input provided'
-                }
-            
-            # Check for potentially dangerous requests first
-            if self._is_dangerous_request(natural_language_input):
-                return {
-                    'success': False,
-                    'error': 'Request contains potentially dangerous operations'
-                }
-            
-            # Create the full prompt
-            full_prompt = f"{self.system_prompt}\n\nInput: {natural_language_input.strip()}\nOutput:"
-            
-            # Generate response using Gemini
-            response = self.model.generate_content(full_prompt)
-            
-            if not response or not response.text:
-                return {
-                    'success': False,
-                    'error': 'No response from AI model'
-                }
-            
-            # Parse the response
-            ai_output = response.text.strip()
-            
-            # Check if AI returned an error
-            if ai_output.startswith('ERROR:'):
-                return {
-                    'success': False,
-                    'error': ai_output[6:].strip()  # Remove "ERROR:" prefix
-                }
-            
-            # Validate the generated command
-            validation_result = self._validate_generated_command(ai_output)
-            
-            if not validation_result['valid']:
-                return {
-                    'success': False,
-                    'error': f"AI generated invalid command: {validation_result['error']}"
-                }
-            
-            return {
-                'success': True,
-                'command': ai_output,
-                'original_input': natural_language_input,
-                'confidence': self._estimate_confidence(natural_language_input, ai_output)
-            }
-            
+            input_lower = natural_language_input.lower()
+            precheck = self._precheck_input(natural_language_input, input_lower)
+            if precheck is not None:
+                return precheck
+
+            fast_path = self._fast_path(natural_language_input, input_lower)
+            if fast_path is not None:
+                return fast_path
+
+            cache_key = _WHITESPACE_RE.sub(' ', input_lower.strip())
+            cached = self._cache_get(self._interpret_cache, cache_key)
+            if cached is not None:
+                return cached
+
+            # Stream the response and stop at the first newline: generated
+            # commands are single-line, so any trailing tokens are wasted
+            # decode latency
+            full_prompt = self._build_prompt(natural_language_input)
+            response = self.model.generate_content(
+                full_prompt, stream=True,
+                generation_config=self._command_gen_config,
+                request_options=self.request_options
+            )
+
+            pieces = []
+            for chunk in response:
+                chunk_text = chunk.text
+                if chunk_text:
+                    pieces.append(chunk_text)
+                    if '\n' in chunk_text:
+                        break
+            ai_output = ''.join(pieces).split('\n', 1)[0]
+
+            result = self._process_output(natural_language_input, input_lower, ai_output)
+            if result['success']:
+                self._cache_put(self._interpret_cache, cache_key, result)
+            return result
+
         except Exception as e:
-            return {
-                'success': False,
-                'error': f'AI interpretation failed: {str(e)}'
-            }
-    
-    def _is_dangerous_request(self, input_text: str) -> bool:
+            return InterpretResult(success=False, error=f'AI interpretation failed: {str(e)}')
+
+    def _cache_get(self, cache: OrderedDict, key: str) -> Optional[InterpretResult]:
+        """Look up a cached result, refreshing its LRU position on a hit."""
+        with self._cache_lock:
+            result = cache.get(key)
+            if result is not None:
+                cache.move_to_end(key)
+            return result
+
+    def _cache_put(self, cache: OrderedDict, key: str, result: Any):
+        """Store a result, evicting the least recently used entry when full."""
+        with self._cache_lock:
+            cache[key] = result
+            cache.move_to_end(key)
+            if len(cache) > self._cache_maxsize:
+                cache.popitem(last=False)
+
+    async def interpret_async(self, natural_language_input: str) -> InterpretResult:
+        """
+        Async variant of interpret() for concurrent use.
+
+        Uses the SDK's non-blocking transport so multiple in-flight Gemini
+        calls can be awaited concurrently (e.g. via asyncio.gather) instead
+        of serializing on a worker thread.
+
+        Args:
+            natural_language_input (str): Natural language command description
+
+        Returns:
+            Dict containing interpretation results
+        """
+        try:
+            input_lower = natural_language_input.lower()
+            precheck = self._precheck_input(natural_language_input, input_lower)
+            if precheck is not None:
+                return precheck
+
+            fast_path = self._fast_path(natural_language_input, input_lower)
+            if fast_path is not None:
+                return fast_path
+
+            cache_key = _WHITESPACE_RE.sub(' ', input_lower.strip())
+            cached = self._cache_get(self._interpret_cache, cache_key)
+            if cached is not None:
+                return cached
+
+            full_prompt = self._build_prompt(natural_language_input)
+            async with _gemini_semaphore():
+                response = await self.model.generate_content_async(
+                    full_prompt,
+                    generation_config=self._command_gen_config,
+                    request_options=self.request_options
+                )
+
+            result = self._process_response(natural_language_input, input_lower, response)
+            if result['success']:
+                self._cache_put(self._interpret_cache, cache_key, result)
+            return result
+
+        except Exception as e:
+            return InterpretResult(success=False, error=f'AI interpretation failed: {str(e)}')
+
+    def batch_interpret(self, inputs: List[str], batch_size: int = 8) -> List[InterpretResult]:
+        """
+        Interpret several natural language inputs with one Gemini call per batch.
+
+        Packs up to batch_size inputs into a single numbered prompt so the
+        system prompt is sent once per batch instead of once per input, and
+        parses the numbered response back into per-input results.
+
+        Args:
+            inputs (List[str]): Natural language command descriptions
+            batch_size (int): Maximum inputs packed into one Gemini call
+
+        Returns:
+            List of interpretation result dicts, one per input, in order
+        """
+        results: List[Optional[InterpretResult]] = [None] * len(inputs)
+
+        # Run local pre-flight checks first; only clean inputs go to Gemini
+        pending = []  # (original index, input text)
+        for index, nl_input in enumerate(inputs):
+            precheck = self._precheck_input(nl_input, nl_input.lower())
+            if precheck is not None:
+                results[index] = precheck
+            else:
+                pending.append((index, nl_input))
+
+        # Cap batch size to keep prompt length (and latency) bounded
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            try:
+                outputs = self._interpret_batch_chunk([text for _, text in batch])
+            except Exception as e:
+                error = InterpretResult(success=False, error=f'AI interpretation failed: {str(e)}')
+                for index, _ in batch:
+                    results[index] = error
+                continue
+
+            for (index, nl_input), output in zip(batch, outputs):
+                if output is None:
+                    results[index] = InterpretResult(success=False, error='No response from AI model')
+                elif output.startswith('ERROR:'):
+                    results[index] = InterpretResult(success=False, error=output[6:].strip())
+                else:
+                    validation_result = self._validate_generated_command(output)
+                    if not validation_result['valid']:
+                        results[index] = InterpretResult(
+                            success=False,
+                            error=f"AI generated invalid command: {validation_result['error']}"
+                        )
+                    else:
+                        results[index] = InterpretResult(
+                            success=True,
+                            command=output,
+                            original_input=nl_input,
+                            confidence=self._estimate_confidence(nl_input.lower(), output)
+                        )
+
+        return results
+
+    def _interpret_batch_chunk(self, batch_inputs: List[str]) -> List[Optional[str]]:
+        """
+        Send one numbered multi-input prompt to Gemini and parse the outputs.
+
+        Args:
+            batch_inputs (List[str]): Inputs for a single batched call
+
+        Returns:
+            List of raw command strings (None where Gemini gave no output),
+            index-aligned with batch_inputs
+        """
+        numbered = '\n'.join(
+            f"Input {i + 1}: {text.strip()}" for i, text in enumerate(batch_inputs)
+        )
+        batch_prompt = (
+            f"{self.system_prompt}\n\n"
+            f"You will receive {len(batch_inputs)} numbered inputs. "
+            f"Respond with one line per input in the form \"Output N: <command>\" "
+            f"(or \"Output N: ERROR: [reason]\"), in order.\n\n"
+            f"{numbered}\n"
+        )
+
+        response = self.model.generate_content(
+            batch_prompt,
+            generation_config=self._batch_gen_config,
+            request_options=self.request_options
+        )
+        if not response or not response.text:
+            return [None] * len(batch_inputs)
+
+        outputs: List[Optional[str]] = [None] * len(batch_inputs)
+        for match in _BATCH_OUTPUT_RE.finditer(response.text):
+            index = int(match.group(1)) - 1
+            if 0 <= index < len(batch_inputs):
+                outputs[index] = match.group(2).strip()
+
+        return outputs
+
+    def _fast_path(self, natural_language_input: str, input_lower: str) -> Optional[InterpretResult]:
+        """
+        Resolve unambiguous inputs locally without a Gemini call.
+
+        Args:
+            natural_language_input (str): Natural language command description
+            input_lower (str): Lowercased copy of the input
+
+        Returns:
+            Interpretation result dict if a fast path matched, None otherwise
+        """
+        stripped = input_lower.strip()
+        for regex, build_command in _FAST_PATHS:
+            match = regex.fullmatch(stripped)
+            if match:
+                return InterpretResult(
+                    success=True,
+                    command=build_command(match),
+                    original_input=natural_language_input,
+                    confidence=0.95
+                )
+        return None
+
+    def _precheck_input(self, natural_language_input: str, input_lower: str) -> Optional[InterpretResult]:
+        """
+        Run the local pre-flight checks shared by the sync and async paths.
+
+        Args:
+            natural_language_input (str): Natural language command description
+            input_lower (str): Lowercased copy of the input
+
+        Returns:
+            Error dict if the input fails validation, None if it may proceed
+        """
+        # isspace() avoids allocating a stripped copy just for the check
+        if not natural_language_input or natural_language_input.isspace():
+            return InterpretResult(success=False, error='Empty input provided')
+
+        # Check for potentially dangerous requests first
+        if self._is_dangerous_request(input_lower):
+            return InterpretResult(
+                success=False,
+                error='Request contains potentially dangerous operations'
+            )
+
+        return None
+
+    def _build_prompt(self, natural_language_input: str) -> str:
+        """Build the full Gemini prompt for a natural language input."""
+        return self._prompt_prefix + natural_language_input.strip() + self._prompt_suffix
+
+    def _process_response(self, natural_language_input: str, input_lower: str, response) -> InterpretResult:
+        """
+        Validate and package a Gemini response, shared by sync and async paths.
+
+        Args:
+            natural_language_input (str): Original natural language input
+            input_lower (str): Lowercased copy of the input
+            response: Gemini response object
+
+        Returns:
+            Dict containing interpretation results
+        """
+        if not response or not response.text:
+            return InterpretResult(success=False, error='No response from AI model')
+
+        return self._process_output(natural_language_input, input_lower, response.text)
+
+    def _process_output(self, natural_language_input: str, input_lower: str, ai_output: str) -> InterpretResult:
+        """
+        Validate and package raw Gemini output text.
+
+        Args:
+            natural_language_input (str): Original natural language input
+            input_lower (str): Lowercased copy of the input
+            ai_output (str): Raw text produced by Gemini
+
+        Returns:
+            Dict containing interpretation results
+        """
+        ai_output = ai_output.strip()
+        if not ai_output:
+            return InterpretResult(success=False, error='No response from AI model')
+
+        # Check if AI returned an error
+        if ai_output.startswith('ERROR:'):
+            # Remove "ERROR:" prefix
+            return InterpretResult(success=False, error=ai_output[6:].strip())
+
+        # Validate the generated command
+        validation_result = self._validate_generated_command(ai_output)
+
+        if not validation_result['valid']:
+            return InterpretResult(
+                success=False,
+                error=f"AI generated invalid command: {validation_result['error']}"
+            )
+
+        return InterpretResult(
+            success=True,
+            command=ai_output,
+            original_input=natural_language_input,
+            confidence=self._estimate_confidence(input_lower, ai_output)
+        )
+
+
+    def _is_dangerous_request(self, input_lower: str) -> bool:
         """
         Check if the input contains dangerous keywords or patterns.
-        
+
         Args:
-            input_text (str): Input text to check
-            
+            input_lower (str): Lowercased input text to check
+
         Returns:
             bool: True if potentially dangerous
         """
-        dangerous_patterns = [
-            r'delete\s+everything',
-            r'format\s+disk',
-            r'wipe\s+system',
-            r'remove\s+all',
-            r'destroy\s+',
-            r'hack\s+',
-            r'password\s+',
-            r'sudo\s+',
-            r'root\s+access',
-            r'system\s+shutdown',
-            r'kill\s+all',
-            r'format\s+drive'
-        ]
-        
-        input_lower = input_text.lower()
-        
-        for pattern in dangerous_patterns:
-            if re.search(pattern, input_lower):
-                return True
-        
-        return False
+        return bool(_DANGEROUS_INPUT_RE.search(input_lower))
     
     def _validate_generated_command(self, command: str) -> Dict[str, Any]:
         """
@@ -189,14 +652,6 @@ Output: ERROR: Destructive operation not allowed
         Returns:
             Dict containing validation results
         """
-        # Define allowed commands
-        allowed_commands = {
-            'ls', 'pwd', 'cd', 'mkdir', 'rmdir', 'rm', 'cp', 'mv', 'touch',
-            'cat', 'head', 'tail', 'find', 'stat', 'echo', 'grep', 'wc',
-            'sort', 'diff', 'ps', 'uptime', 'date', 'env', 'system',
-            'help', 'clear', 'history'
-        }
-        
         # Handle multi-commands with &&
         if '&&' in command:
             # Split by && and validate each command separately
@@ -204,65 +659,63 @@ Output: ERROR: Destructive operation not allowed
             for cmd in commands:
                 if not cmd:
                     continue
-                result = self._validate_single_command(cmd, allowed_commands)
+                result = self._validate_single_command(cmd, _ALLOWED_COMMANDS)
                 if not result['valid']:
                     return result
             return {'valid': True}
         else:
             # Single command validation
-            return self._validate_single_command(command, allowed_commands)
-    
-    def _validate_single_command(self, command: str, allowed_commands: set) -> Dict[str, Any]:
+            return self._validate_single_command(command, _ALLOWED_COMMANDS)
+
+    def _validate_single_command(self, command: str, allowed_commands: frozenset) -> Dict[str, Any]:
         """
         Validate a single command.
-        
+
         Args:
             command (str): Single command to validate
-            allowed_commands (set): Set of allowed commands
-            
+            allowed_commands (frozenset): Set of allowed commands
+
         Returns:
             Dict containing validation results
         """
-        # Parse command
-        command_parts = command.strip().split()
+        # Cheap fixed-string checks first
+        for substring in _DANGEROUS_SUBSTRINGS:
+            if substring in command:
+                return {
+                    'valid': False,
+                    'error': f'Dangerous pattern detected: {substring}'
+                }
+
+        # Parse command (shlex handles quoted arguments safely)
+        try:
+            command_parts = shlex.split(command)
+        except ValueError:
+            return {
+                'valid': False,
+                'error': 'Unbalanced quoting in command'
+            }
         if not command_parts:
             return {
                 'valid': False,
                 'error': 'Empty command'
             }
-        
-        main_command = command_parts[0]
-        
+
+        main_command = sys.intern(command_parts[0])
+
         # Check if command is allowed
         if main_command not in allowed_commands:
             return {
                 'valid': False,
                 'error': f'Command not allowed: {main_command}'
             }
-        
+
         # Check for dangerous patterns in the full command
-        dangerous_patterns = [
-            r'rm\s+-rf\s+/',
-            r'rm\s+-rf\s+\*',
-            r'sudo\s+',
-            r'su\s+',
-            r'chmod\s+777',
-            r'/dev/null',
-            r'&\s*$',
-            r'\|\s*sh',
-            r'`.*`',
-            r'\$\(',
-            r'>\s*/dev/',
-            r'2>&1',
-            r'\|\s*bash'
-        ]
-        
-        for pattern in dangerous_patterns:
-            if re.search(pattern, command):
-                return {
-                    'valid': False,
-                    'error': f'Dangerous pattern detected: {pattern}'
-                }
+        match = _DANGEROUS_CMD_RE.search(command)
+        if match:
+            return {
+                'valid': False,
+                'error': f'Dangerous pattern detected: {_DANGEROUS_CMD_PATTERNS[match.lastgroup]}'
+            }
         
         # Additional validation for rm command
         if main_command == 'rm':
@@ -287,46 +740,30 @@ Output: ERROR: Destructive operation not allowed
             'args': command_parts[1:]
         }
     
-    def _estimate_confidence(self, input_text: str, generated_command: str) -> float:
+    def _estimate_confidence(self, input_lower: str, generated_command: str) -> float:
         """
         Estimate confidence in the AI interpretation.
-        
+
         Args:
-            input_text (str): Original natural language input
+            input_lower (str): Lowercased natural language input
             generated_command (str): Generated command
-            
+
         Returns:
             float: Confidence score between 0 and 1
         """
         confidence = 0.5  # Base confidence
-        
-        # Increase confidence for clear, common patterns
-        clear_patterns = [
-            (r'list\s+(files|directory|contents)', ['ls'], 0.3),
-            (r'show\s+(files|directory)', ['ls'], 0.3),
-            (r'create\s+(folder|directory)', ['mkdir'], 0.3),
-            (r'make\s+(folder|directory)', ['mkdir'], 0.3),
-            (r'copy\s+\w+\s+to\s+\w+', ['cp'], 0.3),
-            (r'move\s+\w+\s+to\s+\w+', ['mv'], 0.3),
-            (r'show\s+(contents?|text)\s+of', ['cat'], 0.3),
-            (r'display\s+(contents?|text)', ['cat'], 0.3),
-            (r'current\s+directory', ['pwd'], 0.3),
-            (r'where\s+am\s+i', ['pwd'], 0.3),
-            (r'system\s+(info|information)', ['system'], 0.3),
-            (r'help|commands', ['help'], 0.3)
-        ]
-        
-        input_lower = input_text.lower()
+
         command_parts = generated_command.split()
-        
-        for pattern, expected_commands, boost in clear_patterns:
-            if re.search(pattern, input_lower):
+
+        # Increase confidence for clear, common patterns
+        for regex, expected_commands, boost in _CLEAR_PATTERNS_RE:
+            if regex.search(input_lower):
                 if command_parts and command_parts[0] in expected_commands:
                     confidence += boost
                 break
         
         # Decrease confidence for complex or unusual requests
-        if len(input_text.split()) > 10:
+        if len(input_lower.split()) > 10:
             confidence -= 0.1
         
         # Decrease confidence for generated commands with many arguments
@@ -347,141 +784,131 @@ Output: ERROR: Destructive operation not allowed
             List of suggested commands with descriptions
         """
         suggestions = []
-        
-        # Define common command patterns and their suggestions
-        patterns = [
-            {
-                'keywords': ['list', 'show', 'display', 'files', 'directory'],
-                'command': 'ls',
-                'description': 'List directory contents',
-                'examples': ['ls', 'ls -la', 'ls /path/to/directory']
-            },
-            {
-                'keywords': ['create', 'make', 'folder', 'directory'],
-                'command': 'mkdir',
-                'description': 'Create directory',
-                'examples': ['mkdir foldername', 'mkdir -p path/to/folder']
-            },
-            {
-                'keywords': ['copy', 'duplicate'],
-                'command': 'cp',
-                'description': 'Copy files or directories',
-                'examples': ['cp source.txt dest.txt', 'cp -r folder1 folder2']
-            },
-            {
-                'keywords': ['move', 'rename'],
-                'command': 'mv',
-                'description': 'Move or rename files',
-                'examples': ['mv old.txt new.txt', 'mv file.txt /path/to/']
-            },
-            {
-                'keywords': ['remove', 'delete'],
-                'command': 'rm',
-                'description': 'Remove files or directories',
-                'examples': ['rm file.txt', 'rm -r directory']
-            },
-            {
-                'keywords': ['content', 'read', 'text'],
-                'command': 'cat',
-                'description': 'Display file contents',
-                'examples': ['cat file.txt', 'cat *.txt']
-            },
-            {
-                'keywords': ['where', 'current', 'location'],
-                'command': 'pwd',
-                'description': 'Show current directory',
-                'examples': ['pwd']
-            },
-            {
-                'keywords': ['system', 'monitor', 'performance'],
-                'command': 'system',
-                'description': 'Show system information',
-                'examples': ['system']
-            }
-        ]
-        
         input_lower = partial_input.lower()
-        
-        for pattern in patterns:
-            # Check if any keywords match the input
-            if any(keyword in input_lower for keyword in pattern['keywords']):
-                suggestions.append({
-                    'command': pattern['command'],
-                    'description': pattern['description'],
-                    'examples': pattern['examples'],
-                    'relevance': self._calculate_relevance(input_lower, pattern['keywords'])
-                })
-        
+        word_count = len(input_lower.split())
+
+        # Single pass over the input collects every keyword hit at once and
+        # accumulates relevance per pattern: 1.0 per distinct keyword plus a
+        # 0.5 bonus when the keyword starts the input
+        scores: Dict[int, float] = {}
+        seen_keywords = set()
+        for match in _SUGGESTION_KEYWORD_RE.finditer(input_lower):
+            keyword = match.group()
+            if keyword in seen_keywords:
+                continue
+            seen_keywords.add(keyword)
+            keyword_score = 1.5 if match.start() == 0 else 1.0
+            for index in _SUGGESTION_KEYWORD_INDEX[keyword]:
+                scores[index] = scores.get(index, 0.0) + keyword_score
+
+        for index, score in scores.items():
+            pattern = _SUGGESTION_PATTERNS[index]
+            suggestions.append({
+                'command': pattern['command'],
+                'description': pattern['description'],
+                'examples': pattern['examples'],
+                'relevance': score / word_count if word_count else score
+            })
+
         # Sort by relevance
         suggestions.sort(key=lambda x: x['relevance'], reverse=True)
-        
+
         return suggestions[:5]  # Return top 5 suggestions
     
-    def _calculate_relevance(self, input_text: str, keywords: List[str]) -> float:
+    def _build_explain_prompt(self, command: str) -> str:
+        """Build the Gemini prompt used to explain a terminal command."""
+        return f"""Explain what this terminal command does in simple, clear language:
+
+Command: {command}
+
+Provide a brief explanation of:
+1. What the command does
+2. What the arguments mean (if any)
+3. What the expected output would be
+
+Keep the explanation concise and user-friendly."""
+
+    def explain_command(self, command: str) -> Dict[str, Any]:
         """
-        Calculate relevance score for a suggestion.
+        Explain what a terminal command does in natural language.
         
         Args:
-            input_text (str): Input text
-            keywords (List[str]): Keywords for the suggestion
+            command (str): Terminal command to explain
             
         Returns:
-            float: Relevance score
+            Dict containing explanation
         """
-        score = 0.0
-        words = input_text.split()
-        
-        for keyword in keywords:
-            if keyword in input_text:
-                # Exact keyword match
-                score += 1.0
-                
-                # Bonus for keyword at start of input
-                if input_text.startswith(keyword):
-                    score += 0.5
-        
-        # Normalize by number of words in input
-        if words:
-            score = score / len(words)
-        
-        return score
-    
-    def explain_command(self, command: str) -> Dict[str, Any]:
+        try:
+            cached = self._cache_get(self._explain_cache, command)
+            if cached is not None:
+                return cached
+
+            explain_prompt = self._build_explain_prompt(command)
+
+            response = self.model.generate_content(
+                explain_prompt,
+                generation_config=self._explain_gen_config,
+                request_options=self.request_options
+            )
+
+            if response and response.text:
+                result = {
+                    'success': True,
+                    'explanation': response.text.strip(),
+                    'command': command
+                }
+                self._cache_put(self._explain_cache, command, result)
+                return result
+            else:
+                return {
+                    'success': False,
+                    'error': 'Could not generate explanation'
+                }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Failed to explain command: {str(e)}'
+            }
+
+    async def explain_command_async(self, command: str) -> Dict[str, Any]:
         """
-        Explain what a terminal command does in natural language.
-        
+        Async variant of explain_command() for concurrent use.
+
         Args:
             command (str): Terminal command to explain
-            
+
         Returns:
             Dict containing explanation
         """
         try:
-            explain_prompt = f"""Explain what this terminal command does in simple, clear language:
+            cached = self._cache_get(self._explain_cache, command)
+            if cached is not None:
+                return cached
 
-Command: {command}
+            explain_prompt = self._build_explain_prompt(command)
 
-Provide a brief explanation of:
-1. What the command does
-2. What the arguments mean (if any)
-3. What the expected output would be
+            async with _gemini_semaphore():
+                response = await self.model.generate_content_async(
+                    explain_prompt,
+                    generation_config=self._explain_gen_config,
+                    request_options=self.request_options
+                )
 
-Keep the explanation concise and user-friendly."""
-            
-            response = self.model.generate_content(explain_prompt)
-            
             if response and response.text:
-                return {
+                result = {
                     'success': True,
                     'explanation': response.text.strip(),
                     'command': command
                 }
+                self._cache_put(self._explain_cache, command, result)
+                return result
             else:
                 return {
                     'success': False,
                     'error': 'Could not generate explanation'
                 }
-                
+
         except Exception as e:
             return {
                 'success': False,
@@ -3,15 +3,323 @@ Command Executor Module
 Handles safe execution of terminal commands with sandboxing and security measures.
 """
 
+import array
+import asyncio
+import bisect
+import concurrent.futures
+import fnmatch
+import functools
+import heapq
+import io
+import mmap
 import os
-import subprocess
+import re
+import stat as stat_module
 import shutil
-import glob
+import struct
 import time
-import json
-from pathlib import Path
+from collections import OrderedDict
+from itertools import islice
+
+from linux_optimized import HAS_STATX, statx_ifmt
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
-from datetime import datetime
+
+# Error template shared by every unknown-command path so dispatch misses
+# don't rebuild the message piecewise.
+_UNKNOWN_CMD_ERROR = 'Unknown command: %s. Type "help" for available commands.'
+
+# Splits '&&' chains and swallows the surrounding whitespace in one pass.
+_AMPAMP = re.compile(r'\s*&&\s*')
+
+# Word runs for wc; counting matches avoids materializing every word the
+# way bytes.split() does.
+_WORD_RE = re.compile(rb'\S+')
+
+_INF = float('inf')
+
+# glibc utmp record layout (384 bytes); ut_type == 7 marks a logged-in user
+_UTMP_STRUCT = struct.Struct('hi32s4s32s256shhiii4i20s')
+_USER_PROCESS = 7
+
+def _count_logged_in_users() -> int:
+    """Count USER_PROCESS utmp records without forking who(1)."""
+    for utmp_path in ('/var/run/utmp', '/run/utmp'):
+        try:
+            with open(utmp_path, 'rb') as f:
+                buf = f.read()
+        except OSError:
+            continue
+        size = _UTMP_STRUCT.size
+        return sum(
+            1 for offset in range(0, len(buf) - size + 1, size)
+            if _UTMP_STRUCT.unpack_from(buf, offset)[0] == _USER_PROCESS
+        )
+    return 1  # assume at least current user
+
+def _read_proc_file(path: str, length: int = 128) -> bytes:
+    """Single open+read of a small /proc file, no text-IO wrapper."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, length)
+    finally:
+        os.close(fd)
+
+def _numeric_sort_key(line: str) -> float:
+    """sort -n key: non-numeric lines (and NaN) collate to the end."""
+    try:
+        value = float(line)
+    except ValueError:
+        return _INF
+    return value if value == value else _INF
+
+# Frozen results for the common fixed-shape returns; callers only read
+# these, so sharing one mapping avoids a dict allocation per command.
+# Handlers whose success path has no output (cd/mkdir/rm/mv/touch/cp)
+# all return _OK_EMPTY; results carrying per-call output or error text
+# still allocate, since their payload differs every time.
+_OK_EMPTY = MappingProxyType({'success': True, 'output': '', 'error': None})
+_PARSE_ERROR = MappingProxyType({'success': False, 'output': '', 'error': 'Command parsing error'})
+_CLEAR_SCREEN = MappingProxyType({'success': True, 'output': '\033[2J\033[H', 'error': None})
+
+_HELP_TEXT = """Available Commands:
+
+File Operations:
+  ls [options] [dir]  - List directory contents
+  pwd                 - Print current directory
+  cd [dir]            - Change directory
+  mkdir <dir>         - Create directory
+  rm [options] <file> - Remove files/directories
+  cp <src> <dest>     - Copy files/directories
+  mv <src> <dest>     - Move/rename files/directories
+  touch <file>        - Create empty file
+  cat <file>          - Display file contents
+
+Text Operations:
+  echo <text>         - Display text
+  grep <pattern> <file> - Search text patterns
+  wc <file>           - Count words, lines, characters
+
+System Info:
+  system              - Show system information
+  ps                  - List processes
+  uptime              - Show system uptime
+  date                - Show current date/time
+
+Utility:
+  help                - Show this help
+  clear               - Clear screen
+  history             - Show command history
+
+Natural Language:
+You can also use natural language commands like:
+"create a folder called test"
+"show me all files in the current directory"
+"copy file1.txt to backup.txt"
+"""
+_HELP_RESULT = MappingProxyType({'success': True, 'output': _HELP_TEXT, 'error': None})
+_HISTORY_RESULT = MappingProxyType({
+    'success': True, 'output': 'Command history will be displayed here', 'error': None
+})
+
+# Command name -> handler method name; compiled after the class body
+# into _HANDLERS, a frozen table of plain functions called as
+# handler(self, args), so dispatch allocates no bound methods at all.
+_HANDLER_NAMES = MappingProxyType({
+    # File operations
+    'ls': '_handle_ls',
+    'pwd': '_handle_pwd',
+    'cd': '_handle_cd',
+    'mkdir': '_handle_mkdir',
+    'rmdir': '_handle_rmdir',
+    'rm': '_handle_rm',
+    'cp': '_handle_cp',
+    'mv': '_handle_mv',
+    'touch': '_handle_touch',
+    'cat': '_handle_cat',
+    'head': '_handle_head',
+    'tail': '_handle_tail',
+    'find': '_handle_find',
+    'tree': '_handle_tree',
+    'stat': '_handle_stat',
+
+    # Text operations
+    'echo': '_handle_echo',
+    'grep': '_handle_grep',
+    'wc': '_handle_wc',
+    'sort': '_handle_sort',
+
+    # System commands
+    'system': '_handle_system',
+    'ps': '_handle_ps',
+    'uptime': '_handle_uptime',
+    'disk': '_handle_disk',
+    'env': '_handle_env',
+    'date': '_handle_date',
+
+    # Utility commands
+    'help': '_handle_help',
+    'clear': '_handle_clear',
+    'history': '_handle_history',
+})
+
+# Sample files seeded into a fresh sandbox. Encoded to bytes at import
+# so setup's os.write sends each one in a single unbuffered syscall
+# (writev would only help if several landed in one file, which they
+# don't — one regular file each).
+_SAMPLE_FILES: Dict[str, bytes] = {
+    'readme.txt': b"Welcome to the web terminal sandbox!\nThis is a safe environment for file operations.",
+    'sample.log': b"2024-01-01 10:00:00 INFO Application started\n2024-01-01 10:01:00 INFO User connected",
+    'config.json': b'{"app_name": "web_terminal", "version": "1.0.0", "debug": false}',
+    'file1.txt': b"This is a sample file for testing file operations.\nYou can move, copy, or edit this file.",
+    # Additional files as shown in user's output
+    'kek': b"Content of kek\n",
+}
+
+# TTL caches for the system command: the formatted output (including the
+# memory/disk snapshots baked into it) is reused for _SYSTEM_TTL seconds,
+# and the O(processes) pid walk refreshes only every _PID_COUNT_TTL.
+_SYSTEM_TTL = 1.0
+_PID_COUNT_TTL = 5.0
+_SYSTEM_CACHE = {'t': 0.0, 'out': None}
+_PID_COUNT_CACHE = {'t': 0.0, 'count': 0}
+
+# date formats once per wall-clock second; %Z dropped since it is always
+# empty on naive datetimes.
+_DATE_FMT = '%Y-%m-%d %H:%M:%S'
+_DATE_CACHE = {'sec': -1, 'out': ''}
+
+# Single worker thread for system sampling so request threads (or an
+# event loop) never block on psutil; the work sleeps in /proc polling
+# and releases the GIL.
+_SYS_EXEC = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='sysinfo')
+
+def _warm_cpu_sampler():
+    """Seed psutil's cpu_percent delta off the request path."""
+    try:
+        psutil.cpu_percent(interval=None)
+    except Exception:
+        pass
+
+_SYS_EXEC.submit(_warm_cpu_sampler)
+
+@functools.lru_cache(maxsize=256)
+def _compile_find_pattern(pattern: str):
+    """Translate a glob pattern to a compiled regex once per process."""
+    return re.compile(fnmatch.translate(pattern))
+
+@functools.lru_cache(maxsize=1024)
+def _uid_name(uid: int) -> str:
+    """Resolve a uid to a user name once; NSS lookups can be slow."""
+    try:
+        import pwd
+        return pwd.getpwuid(uid).pw_name
+    except (ImportError, KeyError):
+        return str(uid)
+
+@functools.lru_cache(maxsize=1024)
+def _gid_name(gid: int) -> str:
+    """Resolve a gid to a group name once; NSS lookups can be slow."""
+    try:
+        import grp
+        return grp.getgrgid(gid).gr_name
+    except (ImportError, KeyError):
+        return str(gid)
+
+def _stat_or_none(path: str):
+    """One stat syscall covering both the exists and type checks."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+@functools.lru_cache(maxsize=256)
+def _compile_grep_pattern(pattern: str):
+    """
+    Compile a grep pattern to a bytes regex once per process.
+
+    Patterns with metacharacters compile as-is (MULTILINE so ^/$ anchor
+    per line); literals and invalid regexes compile escaped, which is
+    equivalent to substring matching.
+    """
+    raw = pattern.encode('utf-8', 'surrogateescape')
+    if any(c in pattern for c in '.^$*+?{}[]\\|()'):
+        try:
+            return re.compile(raw, re.MULTILINE)
+        except re.error:
+            pass
+    return re.compile(re.escape(raw))
+
+# Environment variables the env command is allowed to echo back.
+_SAFE_ENV = frozenset({'PATH', 'HOME', 'USER', 'SHELL', 'TERM', 'PWD', 'LANG', 'LC_ALL'})
+
+# Unit suffixes for _format_bytes, indexed by power of 1024.
+_BYTE_UNITS = ('B', 'K', 'M', 'G', 'T', 'P')
+
+def _format_bytes(bytes_val: int) -> str:
+    """
+    Human-readable byte count (df-style, 1024-based).
+
+    The unit index comes straight from bit_length instead of a divide
+    loop: each power of 1024 is 10 bits, so one shift picks the unit.
+    """
+    idx = min((bytes_val.bit_length() - 1) // 10, 5) if bytes_val else 0
+    return f"{bytes_val / (1 << (10 * idx)):.1f}{_BYTE_UNITS[idx]}"
+
+# Files above this size are mmap'd rather than slurped, so the kernel
+# pages them in lazily instead of copying the whole file up front.
+_MMAP_THRESHOLD = 8 * 1024 * 1024
+
+def _read_file_bytes(path: str):
+    """
+    Read a whole file as bytes in one shot.
+
+    os.open + os.fstat + a single os.read replaces the buffered text
+    reader's many small read() calls (and its second stat for sizing)
+    with three syscalls. Large files come back as a read-only mmap;
+    callers must close() the result when it is one.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0))
+    try:
+        size = os.fstat(fd).st_size
+        if size > _MMAP_THRESHOLD:
+            return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        buf = os.read(fd, size)
+        while len(buf) < size:  # short reads are rare but legal
+            chunk = os.read(fd, size - len(buf))
+            if not chunk:
+                break
+            buf += chunk
+        return buf
+    finally:
+        os.close(fd)
+
+def _copy_file_fast(source: str, dest: str) -> None:
+    """
+    Copy file contents without preserving metadata.
+
+    Uses os.copy_file_range when available (in-kernel copy, reflink-capable
+    on XFS/Btrfs) and falls back to shutil.copyfile, which is itself
+    sendfile-accelerated.
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(source, 'rb') as src, open(dest, 'wb') as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        raise OSError('copy_file_range copied nothing')
+                    remaining -= copied
+            return
+        except OSError:
+            pass
+    shutil.copyfile(source, dest)
 
 class CommandExecutor:
     """
@@ -29,84 +337,82 @@ class CommandExecutor:
         else:
             # Use local sandbox for development
             self.sandbox_dir = os.path.join(os.getcwd(), 'sandbox')
-            
+
+        # Resolve symlinks in the root once, so the prefix containment
+        # checks compare against the real location rather than whatever
+        # alias the sandbox happened to be configured with.
+        self.sandbox_dir = os.path.realpath(self.sandbox_dir)
         self.current_dir = self.sandbox_dir
+        # pwd display string, maintained on cd instead of recomputed
+        # through relpath on every pwd.
+        self._display_path = '/'
         self.max_file_size = 10 * 1024 * 1024  # 10MB max file size
         self.max_output_length = 10000  # Max output length
+
+        # Memoize _safe_path resolutions; keyed by (current_dir, path) so a
+        # cd naturally misses. Cleared by handlers that mutate layout.
+        self._safe_path_cache: Dict[tuple, str] = {}
+        # Prefix with trailing separator so containment checks don't accept
+        # sibling directories like '<sandbox>2'.
+        self._sandbox_prefix = self.sandbox_dir.rstrip(os.sep) + os.sep
         
         # Create sandbox if it doesn't exist
         self._setup_sandbox()
         
-        # Define command handlers
-        self.command_handlers = {
-            # File operations
-            'ls': self._handle_ls,
-            'pwd': self._handle_pwd,
-            'cd': self._handle_cd,
-            'mkdir': self._handle_mkdir,
-            'rmdir': self._handle_rmdir,
-            'rm': self._handle_rm,
-            'cp': self._handle_cp,
-            'mv': self._handle_mv,
-            'touch': self._handle_touch,
-            'cat': self._handle_cat,
-            'head': self._handle_head,
-            'tail': self._handle_tail,
-            'find': self._handle_find,
-            'tree': self._handle_tree,
-            'stat': self._handle_stat,
-            
-            # Text operations
-            'echo': self._handle_echo,
-            'grep': self._handle_grep,
-            'wc': self._handle_wc,
-            'sort': self._handle_sort,
-            
-            # System commands
-            'system': self._handle_system,
-            'ps': self._handle_ps,
-            'uptime': self._handle_uptime,
-            'disk': self._handle_disk,
-            'env': self._handle_env,
-            'date': self._handle_date,
-            
-            # Utility commands
-            'help': self._handle_help,
-            'clear': self._handle_clear,
-            'history': self._handle_history,
+        # Directory listings keyed by (path, mtime_ns) with a short TTL;
+        # repeated ls/find against an unchanged directory skip readdir.
+        self._listing_cache: OrderedDict = OrderedDict()
+        self._listing_cache_max = 1024
+        self._listing_cache_ttl = 2.0
+
+        # Warm the owner/group caches for the ids stat will see most
+        if hasattr(os, 'getuid'):
+            _uid_name(os.getuid())
+            _gid_name(os.getgid())
+
+        # Dispatch by command type in a single dict lookup instead of
+        # re-testing command_type branches on every call.
+        self._type_dispatch = {
+            'empty': self._empty_result,
+            'parse_error': self._parse_error_result,
+            'ai_generated': self._dispatch_ai,
         }
-    
+
+        # ls listing loops specialized per (show_hidden, long_format) so
+        # the per-entry loop carries no flag branches.
+        self._ls_impls = {
+            (False, False): self._ls_plain,
+            (True, False): self._ls_plain_hidden,
+            (False, True): self._ls_long,
+            (True, True): self._ls_long_hidden,
+        }
+
+    # Sandbox dirs already seeded in this process; setup runs once per dir.
+    _sandbox_initialized = set()
+
     def _setup_sandbox(self):
         """Set up the sandbox directory for safe operations."""
+        if self.sandbox_dir in CommandExecutor._sandbox_initialized:
+            return
+
         try:
             os.makedirs(self.sandbox_dir, exist_ok=True)
-            # Create some sample files for testing
-            sample_files = [
-                'readme.txt',
-                'sample.log',
-                'config.json',
-                'file1.txt'
-            ]
-            for filename in sample_files:
-                filepath = os.path.join(self.sandbox_dir, filename)
-                if not os.path.exists(filepath):
-                    with open(filepath, 'w') as f:
-                        if filename == 'readme.txt':
-                            f.write("Welcome to the web terminal sandbox!\nThis is a safe environment for file operations.")
-                        elif filename == 'sample.log':
-                            f.write("2024-01-01 10:00:00 INFO Application started\n2024-01-01 10:01:00 INFO User connected")
-                        elif filename == 'config.json':
-                            f.write('{"app_name": "web_terminal", "version": "1.0.0", "debug": false}')
-                        elif filename == 'file1.txt':
-                            f.write("This is a sample file for testing file operations.\nYou can move, copy, or edit this file.")
-            
-            # Create some additional directories and files for testing
-            test_files = ['kek']  # Create some additional files as shown in user's output
-            for filename in test_files:
-                filepath = os.path.join(self.sandbox_dir, filename)
-                if not os.path.exists(filepath):
-                    with open(filepath, 'w') as f:
-                        f.write(f"Content of {filename}\n")
+
+            # O_CREAT|O_EXCL makes "create only if missing" a single
+            # race-free syscall per file — no existence scan, no buffered
+            # file object.
+            flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL
+            for filename, content in _SAMPLE_FILES.items():
+                try:
+                    fd = os.open(os.path.join(self.sandbox_dir, filename), flags, 0o644)
+                except FileExistsError:
+                    continue
+                try:
+                    os.write(fd, content)
+                finally:
+                    os.close(fd)
+
+            CommandExecutor._sandbox_initialized.add(self.sandbox_dir)
         except Exception as e:
             print(f"Warning: Could not set up sandbox: {e}")
     
@@ -123,58 +429,47 @@ class CommandExecutor:
             Dict containing execution results
         """
         try:
-            if command_type == 'empty':
-                return {
-                    'success': True,
-                    'output': '',
-                    'error': None
-                }
-            
-            if command_type == 'parse_error':
-                return {
-                    'success': False,
-                    'output': '',
-                    'error': 'Command parsing error'
-                }
-            
-            # Handle multi-commands with && operator
-            if command_type == 'ai_generated':
-                if command == 'multi_command' and args:
-                    # Full command passed as first argument
-                    return self._execute_multi_command(args[0])
-                else:
-                    # Reconstruct full command from parts
-                    full_command = command + (' ' + ' '.join(args) if args else '')
-                    if '&&' in full_command:
-                        return self._execute_multi_command(full_command)
-                    else:
-                        # Single AI-generated command, execute normally
-                        if command in self.command_handlers:
-                            return self.command_handlers[command](args)
-                        else:
-                            return {
-                                'success': False,
-                                'output': '',
-                                'error': f'Unknown command: {command}. Type "help" for available commands.'
-                            }
-            
-            # Handle terminal commands
-            if command in self.command_handlers:
-                return self.command_handlers[command](args)
-            else:
-                return {
-                    'success': False,
-                    'output': '',
-                    'error': f'Unknown command: {command}. Type "help" for available commands.'
-                }
-                
+            return self._type_dispatch.get(command_type, self._dispatch_terminal)(command, args)
         except Exception as e:
             return {
                 'success': False,
                 'output': '',
                 'error': f'Execution error: {str(e)}'
             }
-    
+
+    def _empty_result(self, command: str, args: List[str]) -> Dict[str, Any]:
+        """Result for empty input."""
+        return _OK_EMPTY
+
+    def _parse_error_result(self, command: str, args: List[str]) -> Dict[str, Any]:
+        """Result for input the parser could not handle."""
+        return _PARSE_ERROR
+
+    def _dispatch_ai(self, command: str, args: List[str]) -> Dict[str, Any]:
+        """Dispatch an AI-generated command, handling && multi-commands."""
+        if command == 'multi_command' and args:
+            # Full command passed as first argument
+            return self._execute_multi_command(args[0])
+
+        # Reconstruct full command from parts
+        full_command = command + (' ' + ' '.join(args) if args else '')
+        if '&&' in full_command:
+            return self._execute_multi_command(full_command)
+
+        # Single AI-generated command, execute normally
+        return self._dispatch_terminal(command, args)
+
+    def _dispatch_terminal(self, command: str, args: List[str]) -> Dict[str, Any]:
+        """Dispatch a terminal command via a single handler lookup."""
+        handler = _HANDLERS.get(command)
+        if handler is not None:
+            return handler(self, args)
+        return {
+            'success': False,
+            'output': '',
+            'error': _UNKNOWN_CMD_ERROR % command
+        }
+
     def _execute_multi_command(self, full_command: str) -> Dict[str, Any]:
         """
         Execute multiple commands connected with && operator.
@@ -186,44 +481,49 @@ class CommandExecutor:
             Dict containing execution results
         """
         try:
-            # Split by && operator
-            commands = [cmd.strip() for cmd in full_command.split('&&')]
-            outputs = []
-            
+            # Split by && operator; skip the regex for the common
+            # single-command case.
+            stripped = full_command.strip()
+            commands = _AMPAMP.split(stripped) if '&&' in stripped else [stripped]
+
+            # Append outputs into one growable buffer instead of joining
+            # fresh strings on every exit branch.
+            buf = io.StringIO()
+
             for cmd in commands:
                 if not cmd:
                     continue
-                    
-                # Parse individual command
-                parts = cmd.split()
-                if not parts:
-                    continue
-                    
+
+                # Split off the command name, then tokenize args once
+                parts = cmd.split(None, 1)
                 command_name = parts[0]
-                command_args = parts[1:] if len(parts) > 1 else []
-                
+                command_args = parts[1].split() if len(parts) == 2 else []
+
                 # Execute individual command
-                if command_name in self.command_handlers:
-                    result = self.command_handlers[command_name](command_args)
+                handler = _HANDLERS.get(command_name)
+                if handler is not None:
+                    result = handler(self, command_args)
                     if not result['success']:
                         # If any command fails, stop execution and return error
+                        buf.write(result['output'] or '')
                         return {
                             'success': False,
-                            'output': '\n'.join(outputs) + '\n' + (result['output'] or ''),
+                            'output': buf.getvalue().rstrip('\n'),
                             'error': result['error']
                         }
                     if result['output']:
-                        outputs.append(result['output'])
+                        buf.write(result['output'])
+                        buf.write('\n')
                 else:
                     return {
                         'success': False,
-                        'output': '\n'.join(outputs),
+                        'output': buf.getvalue().rstrip('\n'),
                         'error': f'Unknown command: {command_name}'
                     }
-            
+
             return {
                 'success': True,
-                'output': '\n'.join(outputs),
+                'output': buf.getvalue().rstrip('\n'),
                 'error': None
             }
             
@@ -246,27 +546,53 @@ class CommandExecutor:
         """
         if not path or path == '.':
             return self.current_dir
-        
+
+        # Plain filenames — no separators, no parent references — are
+        # trivially contained; join them straight onto current_dir
+        # without the resolver or the cache. This is the cat/rm/touch
+        # common case.
+        if '/' not in path and '\\' not in path and '..' not in path:
+            return os.path.join(self.current_dir, path)
+
+        # Paths that are already canonical sandbox paths (as produced by
+        # earlier _safe_path calls and handed back by loops) skip the
+        # resolve and the cache entirely; normpath == path guarantees no
+        # '..'/'//'/'./' segments survive the prefix check.
+        if path.startswith(self._sandbox_prefix) and os.path.normpath(path) == path:
+            return path
+
+        cache = self._safe_path_cache
+        key = (self.current_dir, path)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+        resolved = self._resolve_safe_path(path)
+        if len(cache) > 1024:
+            cache.clear()
+        cache[key] = resolved
+        return resolved
+
+    def _resolve_safe_path(self, path: str) -> str:
+        """Resolve a path against current_dir, clamped to the sandbox."""
         if path == '..':
             parent = os.path.dirname(self.current_dir)
-            if parent.startswith(self.sandbox_dir):
+            if parent == self.sandbox_dir or parent.startswith(self._sandbox_prefix):
                 return parent
             return self.sandbox_dir
-        
+
         if os.path.isabs(path):
             # Convert absolute path to relative within sandbox
             path = path.lstrip('/')
-        
-        if path.startswith('../'):
-            # Handle relative paths with ..
-            full_path = os.path.abspath(os.path.join(self.current_dir, path))
-        else:
-            full_path = os.path.abspath(os.path.join(self.current_dir, path))
-        
+
+        # current_dir is always absolute, so normpath alone canonicalizes
+        # the join; abspath would only add an isabs re-check.
+        full_path = os.path.normpath(os.path.join(self.current_dir, path))
+
         # Ensure path is within sandbox
-        if not full_path.startswith(self.sandbox_dir):
+        if full_path != self.sandbox_dir and not full_path.startswith(self._sandbox_prefix):
             return os.path.join(self.sandbox_dir, os.path.basename(path))
-        
+
         return full_path
     
     # File operation handlers
@@ -277,13 +603,13 @@ class CommandExecutor:
             show_hidden = False
             long_format = False
             
-            # Parse arguments
+            # Parse arguments; grouped flags become one set build with
+            # O(1) membership checks instead of linear scans per letter.
             for arg in args:
                 if arg.startswith('-'):
-                    if 'a' in arg:
-                        show_hidden = True
-                    if 'l' in arg:
-                        long_format = True
+                    flags = set(arg[1:])
+                    show_hidden |= 'a' in flags
+                    long_format |= 'l' in flags
                 else:
                     target_dir = self._safe_path(arg)
             
@@ -293,53 +619,145 @@ class CommandExecutor:
             if not os.path.isdir(target_dir):
                 return {'success': False, 'output': '', 'error': f'Not a directory: {target_dir}'}
             
-            items = []
-            for item in os.listdir(target_dir):
-                if not show_hidden and item.startswith('.'):
-                    continue
-                
-                item_path = os.path.join(target_dir, item)
-                
-                if long_format:
-                    stat = os.stat(item_path)
-                    size = stat.st_size
-                    mtime = datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M')
-                    is_dir = os.path.isdir(item_path)
-                    permissions = 'drwxr-xr-x' if is_dir else '-rw-r--r--'
-                    items.append(f'{permissions} {size:>8} {mtime} {item}')
-                else:
-                    items.append(item)
-            
-            output = '\n'.join(sorted(items)) if items else ''
-            return {'success': True, 'output': output, 'error': None}
-            
+            items = self._ls_impls[(show_hidden, long_format)](target_dir)
+
+            # The listing impls all return fresh lists, so sorting in
+            # place avoids a second full-size list from sorted().
+            items.sort()
+            return {'success': True, 'output': '\n'.join(items), 'error': None}
+
         except Exception as e:
             return {'success': False, 'output': '', 'error': str(e)}
-    
+
+    def _cached_scandir(self, path: str) -> tuple:
+        """
+        Return sorted (dir_names, file_names) for a directory, cached briefly.
+
+        Keyed by (path, st_mtime_ns) so any change to the directory is an
+        automatic miss; the TTL bounds staleness from same-second writes.
+        Each half is stored sorted, so cache hits skip the sort as well
+        as the readdir.
+        """
+        key = (path, os.stat(path).st_mtime_ns)
+        now = time.monotonic()
+        cache = self._listing_cache
+        hit = cache.get(key)
+        if hit is not None and now - hit[0] < self._listing_cache_ttl:
+            cache.move_to_end(key)
+            return hit[1]
+
+        dirs: List[str] = []
+        files: List[str] = []
+        with os.scandir(path) as it:
+            for entry in it:
+                (dirs if entry.is_dir(follow_symlinks=False) else files).append(entry.name)
+        dirs.sort()
+        files.sort()
+
+        cache[key] = (now, (dirs, files))
+        cache.move_to_end(key)
+        if len(cache) > self._listing_cache_max:
+            cache.popitem(last=False)
+        return dirs, files
+
+    def _invalidate_fs_caches(self):
+        """Drop caches made stale by a write command."""
+        self._safe_path_cache.clear()
+        self._listing_cache.clear()
+
+    # Specialized listing loops; each contains only the work its flag
+    # combination needs. DirEntry caches stat/type data from the directory
+    # read, avoiding per-entry stat+isdir syscalls.
+    def _ls_plain(self, target_dir: str) -> List[str]:
+        """Names only, hidden entries excluded."""
+        dirs, files = self._cached_scandir(target_dir)
+        return [name for name in dirs + files if not name.startswith('.')]
+
+    def _ls_plain_hidden(self, target_dir: str) -> List[str]:
+        """Names only, hidden entries included."""
+        dirs, files = self._cached_scandir(target_dir)
+        return dirs + files
+
+    # Both long-format impls stat with follow_symlinks=False: the type
+    # bits come from the dirent buffer where the kernel provides them,
+    # and a symlink pointing outside the sandbox is described rather
+    # than resolved.
+    def _ls_long(self, target_dir: str) -> List[str]:
+        """Long format, hidden entries excluded."""
+        strftime = time.strftime
+        localtime = time.localtime
+        mtime_cache: Dict[int, str] = {}
+        items = []
+        append = items.append
+        with os.scandir(target_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith('.'):
+                    continue
+                stat = entry.stat(follow_symlinks=False)
+                # Entries written in the same minute share one strftime
+                minute = int(stat.st_mtime) // 60
+                mtime = mtime_cache.get(minute)
+                if mtime is None:
+                    mtime = strftime('%Y-%m-%d %H:%M', localtime(stat.st_mtime))
+                    mtime_cache[minute] = mtime
+                permissions = 'drwxr-xr-x' if entry.is_dir(follow_symlinks=False) else '-rw-r--r--'
+                append(f'{permissions} {stat.st_size:>8} {mtime} {name}')
+        return items
+
+    def _ls_long_hidden(self, target_dir: str) -> List[str]:
+        """Long format, hidden entries included."""
+        strftime = time.strftime
+        localtime = time.localtime
+        mtime_cache: Dict[int, str] = {}
+        items = []
+        append = items.append
+        with os.scandir(target_dir) as it:
+            for entry in it:
+                stat = entry.stat(follow_symlinks=False)
+                minute = int(stat.st_mtime) // 60
+                mtime = mtime_cache.get(minute)
+                if mtime is None:
+                    mtime = strftime('%Y-%m-%d %H:%M', localtime(stat.st_mtime))
+                    mtime_cache[minute] = mtime
+                permissions = 'drwxr-xr-x' if entry.is_dir(follow_symlinks=False) else '-rw-r--r--'
+                append(f'{permissions} {stat.st_size:>8} {mtime} {entry.name}')
+        return items
+
     def _handle_pwd(self, args: List[str]) -> Dict[str, Any]:
         """Handle pwd command."""
-        # Return relative path within sandbox
-        rel_path = os.path.relpath(self.current_dir, self.sandbox_dir)
-        display_path = '/' if rel_path == '.' else f'/{rel_path}'
-        return {'success': True, 'output': display_path, 'error': None}
-    
+        return {'success': True, 'output': self._display_path, 'error': None}
+
     def _handle_cd(self, args: List[str]) -> Dict[str, Any]:
         """Handle cd command."""
         try:
             if not args:
                 self.current_dir = self.sandbox_dir
-                return {'success': True, 'output': '', 'error': None}
+                self._display_path = '/'
+                return _OK_EMPTY
             
             target_dir = self._safe_path(args[0])
-            
-            if not os.path.exists(target_dir):
-                return {'success': False, 'output': '', 'error': f'Directory not found: {args[0]}'}
-            
-            if not os.path.isdir(target_dir):
-                return {'success': False, 'output': '', 'error': f'Not a directory: {args[0]}'}
+
+            # cd only needs the type bits; statx can answer without
+            # forcing a metadata sync where available.
+            if HAS_STATX:
+                ifmt = statx_ifmt(target_dir)
+                if ifmt is None:
+                    return {'success': False, 'output': '', 'error': f'Directory not found: {args[0]}'}
+                if ifmt != stat_module.S_IFDIR:
+                    return {'success': False, 'output': '', 'error': f'Not a directory: {args[0]}'}
+            else:
+                st = _stat_or_none(target_dir)
+                if st is None:
+                    return {'success': False, 'output': '', 'error': f'Directory not found: {args[0]}'}
+                if not stat_module.S_ISDIR(st.st_mode):
+                    return {'success': False, 'output': '', 'error': f'Not a directory: {args[0]}'}
             
             self.current_dir = target_dir
-            return {'success': True, 'output': '', 'error': None}
+            rel_path = os.path.relpath(target_dir, self.sandbox_dir)
+            self._display_path = '/' if rel_path == '.' else f'/{rel_path}'
+            self._invalidate_fs_caches()
+            return _OK_EMPTY
             
         except Exception as e:
             return {'success': False, 'output': '', 'error': str(e)}
@@ -353,8 +771,9 @@ class CommandExecutor:
             for dirname in args:
                 dir_path = self._safe_path(dirname)
                 os.makedirs(dir_path, exist_ok=True)
-            
-            return {'success': True, 'output': '', 'error': None}
+
+            self._invalidate_fs_caches()
+            return _OK_EMPTY
             
         except Exception as e:
             return {'success': False, 'output': '', 'error': str(e)}
@@ -371,30 +790,31 @@ class CommandExecutor:
             
             for arg in args:
                 if arg.startswith('-'):
-                    if 'r' in arg or 'R' in arg:
-                        recursive = True
-                    if 'f' in arg:
-                        force = True
+                    flags = set(arg[1:])
+                    recursive |= 'r' in flags or 'R' in flags
+                    force |= 'f' in flags
                 else:
                     files_to_remove.append(arg)
             
             for filename in files_to_remove:
                 file_path = self._safe_path(filename)
-                
-                if not os.path.exists(file_path):
+
+                st = _stat_or_none(file_path)
+                if st is None:
                     if not force:
                         return {'success': False, 'output': '', 'error': f'File not found: {filename}'}
                     continue
-                
-                if os.path.isdir(file_path):
+
+                if stat_module.S_ISDIR(st.st_mode):
                     if recursive:
                         shutil.rmtree(file_path)
                     else:
                         return {'success': False, 'output': '', 'error': f'Cannot remove directory without -r flag: {filename}'}
                 else:
                     os.remove(file_path)
-            
-            return {'success': True, 'output': '', 'error': None}
+
+            self._invalidate_fs_caches()
+            return _OK_EMPTY
             
         except Exception as e:
             return {'success': False, 'output': '', 'error': str(e)}
@@ -409,22 +829,25 @@ class CommandExecutor:
             
             for filename in args:
                 file_path = self._safe_path(filename)
-                
-                if not os.path.exists(file_path):
+
+                st = _stat_or_none(file_path)
+                if st is None:
                     return {'success': False, 'output': '', 'error': f'File not found: {filename}'}
-                
-                if os.path.isdir(file_path):
+
+                if stat_module.S_ISDIR(st.st_mode):
                     return {'success': False, 'output': '', 'error': f'Is a directory: {filename}'}
-                
-                # Check file size
-                if os.path.getsize(file_path) > self.max_file_size:
-                    return {'success': False, 'output': '', 'error': f'File too large: {filename}'}
-                
-                with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                    content = f.read()
-                    if len(content) > self.max_output_length:
-                        content = content[:self.max_output_length] + '\n... (output truncated)'
-                    output_lines.append(content)
+
+                # Read the output cap plus one probe byte in a single
+                # request, so a huge file never gets pulled into memory
+                # just to be truncated.
+                cap = self.max_output_length
+                with open(file_path, 'rb') as f:
+                    data = f.read(cap + 1)
+
+                content = data[:cap].decode('utf-8', errors='replace')
+                if len(data) > cap:
+                    content += '\n... (output truncated)'
+                output_lines.append(content)
             
             return {'success': True, 'output': '\n'.join(output_lines), 'error': None}
             
@@ -438,91 +861,86 @@ class CommandExecutor:
     
     def _handle_touch(self, args: List[str]) -> Dict[str, Any]:
         """Handle touch command."""
-        try:
-            if not args:
-                return {'success': False, 'output': '', 'error': 'touch: missing filename'}
-            
-            for filename in args:
-                file_path = self._safe_path(filename)
-                Path(file_path).touch()
-            
-            return {'success': True, 'output': '', 'error': None}
-            
-        except Exception as e:
-            return {'success': False, 'output': '', 'error': str(e)}
+        if not args:
+            return {'success': False, 'output': '', 'error': 'touch: missing filename'}
+
+        # open+utime mirrors touch(1) in two syscalls per file, without
+        # Path.touch()'s object allocation and extra stat.
+        flags = os.O_WRONLY | os.O_CREAT | os.O_NOCTTY
+        errors = []
+        for filename in args:
+            file_path = self._safe_path(filename)
+            try:
+                os.close(os.open(file_path, flags, 0o666))
+                os.utime(file_path, None)
+            except OSError as e:
+                errors.append(f'touch: {filename}: {e.strerror or e}')
+
+        self._invalidate_fs_caches()
+        if errors:
+            return {'success': False, 'output': '', 'error': '\n'.join(errors)}
+        return _OK_EMPTY
     
     def _handle_system(self, args: List[str]) -> Dict[str, Any]:
         """Handle system info command."""
         try:
-            import psutil
-            
-            # Get system information
-            cpu_percent = psutil.cpu_percent(interval=1)
+            now = time.monotonic()
+            if _SYSTEM_CACHE['out'] is not None and now - _SYSTEM_CACHE['t'] < _SYSTEM_TTL:
+                return {'success': True, 'output': _SYSTEM_CACHE['out'], 'error': None}
+
+            # Non-blocking sampling: returns usage since the previous call
+            # instead of sleeping for a 1s interval.
+            cpu_percent = psutil.cpu_percent(interval=None)
             memory = psutil.virtual_memory()
             disk = psutil.disk_usage('/')
-            
+
+            if now - _PID_COUNT_CACHE['t'] >= _PID_COUNT_TTL:
+                _PID_COUNT_CACHE['count'] = len(psutil.pids())
+                _PID_COUNT_CACHE['t'] = now
+
             output = f"""System Information:
 CPU Usage: {cpu_percent}%
 Memory: {memory.percent}% used ({memory.used // (1024**3):.1f}GB / {memory.total // (1024**3):.1f}GB)
 Disk: {disk.percent}% used ({disk.used // (1024**3):.1f}GB / {disk.total // (1024**3):.1f}GB)
-Processes: {len(psutil.pids())}"""
-            
+Processes: {_PID_COUNT_CACHE['count']}"""
+
+            _SYSTEM_CACHE['t'] = now
+            _SYSTEM_CACHE['out'] = output
+
             return {'success': True, 'output': output, 'error': None}
+
+        except Exception as e:
+            return {'success': False, 'output': '', 'error': str(e)}
+
+    async def _handle_system_async(self, args: List[str]) -> Dict[str, Any]:
+        """Async variant of _handle_system; samples on the sysinfo thread."""
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_SYS_EXEC, self._handle_system, args)
             
         except Exception as e:
             return {'success': False, 'output': '', 'error': str(e)}
     
     def _handle_help(self, args: List[str]) -> Dict[str, Any]:
         """Handle help command."""
-        help_text = """Available Commands:
+        return _HELP_RESULT
 
-File Operations:
-  ls [options] [dir]  - List directory contents
-  pwd                 - Print current directory
-  cd [dir]            - Change directory
-  mkdir <dir>         - Create directory
-  rm [options] <file> - Remove files/directories
-  cp <src> <dest>     - Copy files/directories
-  mv <src> <dest>     - Move/rename files/directories
-  touch <file>        - Create empty file
-  cat <file>          - Display file contents
-
-Text Operations:
-  echo <text>         - Display text
-  grep <pattern> <file> - Search text patterns
-  wc <file>           - Count words, lines, characters
-
-System Info:
-  system              - Show system information
-  ps                  - List processes
-  uptime              - Show system uptime
-  date                - Show current date/time
-
-Utility:
-  help                - Show this help
-  clear               - Clear screen
-  history             - Show command history
-
-Natural Language:
-You can also use natural language commands like:
-"create a folder called test"
-"show me all files in the current directory"
-"copy file1.txt to backup.txt"
-"""
-        return {'success': True, 'output': help_text, 'error': None}
-    
     def _handle_clear(self, args: List[str]) -> Dict[str, Any]:
         """Handle clear command."""
-        return {'success': True, 'output': '\033[2J\033[H', 'error': None}
-    
+        return _CLEAR_SCREEN
+
     def _handle_history(self, args: List[str]) -> Dict[str, Any]:
         """Handle history command - placeholder for database integration."""
-        return {'success': True, 'output': 'Command history will be displayed here', 'error': None}
+        return _HISTORY_RESULT
     
     def _handle_date(self, args: List[str]) -> Dict[str, Any]:
         """Handle date command."""
-        current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S %Z')
-        return {'success': True, 'output': current_time, 'error': None}
+        now_sec = int(time.time())
+        if now_sec != _DATE_CACHE['sec']:
+            _DATE_CACHE['sec'] = now_sec
+            # time.strftime skips the datetime-object construction
+            _DATE_CACHE['out'] = time.strftime(_DATE_FMT, time.localtime(now_sec))
+        return {'success': True, 'output': _DATE_CACHE['out'], 'error': None}
     
     # Placeholder handlers for other commands
     def _handle_rmdir(self, args: List[str]) -> Dict[str, Any]:
@@ -541,44 +959,45 @@ You can also use natural language commands like:
             
             source_path = self._safe_path(args[0])
             dest_path = self._safe_path(args[1])
-            
-            # Check if source exists
-            if not os.path.exists(source_path):
+
+            # Check if source exists (single stat reused for the type checks)
+            source_st = _stat_or_none(source_path)
+            if source_st is None:
                 return {
                     'success': False,
                     'output': '',
                     'error': f"cp: cannot stat '{args[0]}': No such file or directory"
                 }
-            
+
             # If destination is a directory, copy source into it
-            if os.path.isdir(dest_path):
+            dest_st = _stat_or_none(dest_path)
+            if dest_st is not None and stat_module.S_ISDIR(dest_st.st_mode):
                 dest_path = os.path.join(dest_path, os.path.basename(source_path))
-            
+                dest_st = _stat_or_none(dest_path)
+
             # Check if destination already exists
-            if os.path.exists(dest_path):
+            if dest_st is not None:
                 return {
                     'success': False,
                     'output': '',
                     'error': f"cp: cannot copy '{args[0]}' to '{args[1]}': File exists"
                 }
-            
-            # Perform the copy
-            if os.path.isfile(source_path):
-                shutil.copy2(source_path, dest_path)
-            elif os.path.isdir(source_path):
-                shutil.copytree(source_path, dest_path)
+
+            # Perform the copy; sandbox copies don't need metadata
+            # preservation, so skip copy2's stat/chmod/utime round trips.
+            if stat_module.S_ISREG(source_st.st_mode):
+                _copy_file_fast(source_path, dest_path)
+            elif stat_module.S_ISDIR(source_st.st_mode):
+                shutil.copytree(source_path, dest_path, copy_function=_copy_file_fast)
             else:
                 return {
                     'success': False,
                     'output': '',
                     'error': f"cp: '{args[0]}' is not a regular file or directory"
                 }
-            
-            return {
-                'success': True,
-                'output': '',
-                'error': None
-            }
+
+            self._invalidate_fs_caches()
+            return _OK_EMPTY
             
         except Exception as e:
             return {
@@ -599,21 +1018,23 @@ You can also use natural language commands like:
             
             source_path = self._safe_path(args[0])
             dest_path = self._safe_path(args[1])
-            
-            # Check if source exists
-            if not os.path.exists(source_path):
+
+            # Check if source exists (single stat)
+            if _stat_or_none(source_path) is None:
                 return {
                     'success': False,
                     'output': '',
                     'error': f"mv: cannot stat '{args[0]}': No such file or directory"
                 }
-            
+
             # If destination is a directory, move source into it
-            if os.path.isdir(dest_path):
+            dest_st = _stat_or_none(dest_path)
+            if dest_st is not None and stat_module.S_ISDIR(dest_st.st_mode):
                 dest_path = os.path.join(dest_path, os.path.basename(source_path))
-            
+                dest_st = _stat_or_none(dest_path)
+
             # Check if destination already exists
-            if os.path.exists(dest_path):
+            if dest_st is not None:
                 return {
                     'success': False,
                     'output': '',
@@ -622,12 +1043,9 @@ You can also use natural language commands like:
             
             # Perform the move
             shutil.move(source_path, dest_path)
-            
-            return {
-                'success': True,
-                'output': '',
-                'error': None
-            }
+            self._invalidate_fs_caches()
+
+            return _OK_EMPTY
             
         except Exception as e:
             return {
@@ -685,13 +1103,11 @@ You can also use natural language commands like:
                     'error': f'head: error reading \'{file_path}\': Is a directory'
                 }
             
-            with open(safe_path, 'r', encoding='utf-8', errors='ignore') as f:
-                result_lines = []
-                for i, line in enumerate(f):
-                    if i >= lines:
-                        break
-                    result_lines.append(line.rstrip())
-            
+            # Binary read + islice: only the N kept lines are ever decoded.
+            with open(safe_path, 'rb') as f:
+                raw = list(islice(f, lines))
+            result_lines = [line.rstrip(b'\r\n').decode('utf-8', errors='replace') for line in raw]
+
             return {
                 'success': True,
                 'output': '\n'.join(result_lines),
@@ -754,16 +1170,36 @@ You can also use natural language commands like:
                     'error': f'tail: error reading \'{file_path}\': Is a directory'
                 }
             
-            with open(safe_path, 'r', encoding='utf-8', errors='ignore') as f:
-                all_lines = f.readlines()
-                
-            # Get last 'lines' number of lines
-            result_lines = all_lines[-lines:] if len(all_lines) > lines else all_lines
-            result_lines = [line.rstrip() for line in result_lines]
-            
+            # Read fixed-size blocks backwards from EOF until enough
+            # newlines are seen, so tail cost scales with the lines
+            # requested rather than the file size.
+            buf = b''
+            with open(safe_path, 'rb') as f:
+                f.seek(0, 2)
+                remaining = f.tell()
+                while remaining > 0:
+                    block = min(8192, remaining)
+                    remaining -= block
+                    f.seek(remaining)
+                    buf = f.read(block) + buf
+                    if buf.count(b'\n') > lines:
+                        break
+
+            all_lines = buf.split(b'\n')
+            if all_lines and all_lines[-1] == b'':
+                all_lines.pop()
+            result_lines = [
+                line.rstrip(b'\r').decode('utf-8', errors='ignore')
+                for line in all_lines[-lines:]
+            ]
+
+            output = '\n'.join(result_lines)
+            if len(output) > self.max_output_length:
+                output = output[:self.max_output_length] + '\n... (output truncated)'
+
             return {
                 'success': True,
-                'output': '\n'.join(result_lines),
+                'output': output,
                 'error': None
             }
             
@@ -791,21 +1227,34 @@ You can also use natural language commands like:
             if not search_dir.startswith(self.sandbox_dir):
                 search_dir = self.sandbox_dir
             
+            # Build the match predicate once. Glob patterns compile to a
+            # cached regex; plain strings keep substring matching.
+            if pattern == '*':
+                matches = None
+            elif any(c in pattern for c in '*?['):
+                matches = _compile_find_pattern(pattern).match
+            else:
+                matches = lambda name: pattern in name
+
             results = []
-            
-            # Simple find implementation
-            for root, dirs, files in os.walk(search_dir):
-                # Search directories
-                for dir_name in dirs:
-                    if pattern == '*' or pattern in dir_name:
-                        rel_path = os.path.relpath(os.path.join(root, dir_name), self.current_dir)
-                        results.append(f'./{rel_path}')
-                
-                # Search files
-                for file_name in files:
-                    if pattern == '*' or pattern in file_name:
-                        rel_path = os.path.relpath(os.path.join(root, file_name), self.current_dir)
-                        results.append(f'./{rel_path}')
+            relpath = os.path.relpath
+            join = os.path.join
+            current_dir = self.current_dir
+
+            # Recurse over the cached (dirs, files) partitions; repeat
+            # finds against an unchanged tree skip readdir entirely.
+            def _walk(directory):
+                dirs, files = self._cached_scandir(directory)
+                for name in dirs:
+                    path = join(directory, name)
+                    if matches is None or matches(name):
+                        results.append(f'./{relpath(path, current_dir)}')
+                    _walk(path)
+                for name in files:
+                    if matches is None or matches(name):
+                        results.append(f'./{relpath(join(directory, name), current_dir)}')
+
+            _walk(search_dir)
             
             if not results:
                 return {
@@ -875,50 +1324,52 @@ You can also use natural language commands like:
                     'error': f'tree: {args[0] if args and not args[0].startswith("-") else root_path}: Not a directory'
                 }
             
-            # Generate tree structure
+            # Counts accumulate during the single traversal below, so no
+            # second walk over the tree is needed.
+            counts = {'dirs': 0, 'files': 0}
+
+            # Generate tree structure from the shared listing cache; each
+            # directory is classified in a single scandir sweep, and the
+            # dirs list doubles as the recursion guide so no per-entry
+            # isdir re-checks are needed.
+            join = os.path.join
+
             def generate_tree(path, prefix="", depth=0):
                 if max_depth is not None and depth >= max_depth:
                     return []
-                
+
                 items = []
                 try:
-                    entries = sorted(os.listdir(path))
-                    dirs = [e for e in entries if os.path.isdir(os.path.join(path, e))]
-                    files = [e for e in entries if os.path.isfile(os.path.join(path, e))]
+                    dirs, files = self._cached_scandir(path)
+                    counts['dirs'] += len(dirs)
+                    counts['files'] += len(files)
+                    dir_count = len(dirs)
                     all_entries = dirs + files
-                    
-                    for i, entry in enumerate(all_entries):
-                        is_last = i == len(all_entries) - 1
+                    last_index = len(all_entries) - 1
+
+                    for i, name in enumerate(all_entries):
+                        is_last = i == last_index
                         current_prefix = "└── " if is_last else "├── "
-                        items.append(f"{prefix}{current_prefix}{entry}")
-                        
-                        entry_path = os.path.join(path, entry)
-                        if os.path.isdir(entry_path) and (max_depth is None or depth + 1 < max_depth):
+                        items.append(f"{prefix}{current_prefix}{name}")
+
+                        if i < dir_count and (max_depth is None or depth + 1 < max_depth):
                             extension = "    " if is_last else "│   "
-                            items.extend(generate_tree(entry_path, prefix + extension, depth + 1))
-                            
+                            items.extend(generate_tree(join(path, name), prefix + extension, depth + 1))
+
                 except PermissionError:
                     items.append(f"{prefix}[error opening dir]")
-                
+
                 return items
-            
+
             # Start with root directory name
             root_name = os.path.basename(root_path) or root_path
             result = [root_name]
-            
+
             # Add tree structure
-            tree_lines = generate_tree(root_path)
-            result.extend(tree_lines)
-            
-            # Count directories and files
-            dir_count = 0
-            file_count = 0
-            for root, dirs, files in os.walk(root_path):
-                dir_count += len(dirs)
-                file_count += len(files)
-            
+            result.extend(generate_tree(root_path))
+
             result.append("")
-            result.append(f"{dir_count} directories, {file_count} files")
+            result.append(f"{counts['dirs']} directories, {counts['files']} files")
             
             return {
                 'success': True,
@@ -952,12 +1403,7 @@ You can also use natural language commands like:
                     'output': '',
                     'error': f'stat: cannot stat \'{file_path}\': No such file or directory'
                 }
-            
-            import time
-            import pwd
-            import grp
-            import stat as stat_module
-            
+
             # Get file stats
             file_stat = os.stat(safe_path)
             
@@ -975,31 +1421,28 @@ You can also use natural language commands like:
             # Permissions
             perms = stat_module.filemode(mode)
             
-            # Owner and group
-            try:
-                owner = pwd.getpwuid(file_stat.st_uid).pw_name
-            except:
-                owner = str(file_stat.st_uid)
-            
-            try:
-                group = grp.getgrgid(file_stat.st_gid).gr_name
-            except:
-                group = str(file_stat.st_gid)
+            # Owner and group (cached across calls)
+            owner = _uid_name(file_stat.st_uid)
+            group = _gid_name(file_stat.st_gid)
             
             # Times
             access_time = time.ctime(file_stat.st_atime)
             modify_time = time.ctime(file_stat.st_mtime)
             change_time = time.ctime(file_stat.st_ctime)
             
-            # Build output
-            output = f"  File: {file_path}\n"
-            output += f"  Size: {file_stat.st_size:<10} Blocks: {file_stat.st_blocks:<10} IO Block: {file_stat.st_blksize} {file_type}\n"
-            output += f"Device: {file_stat.st_dev:x}h/{file_stat.st_dev}d    Inode: {file_stat.st_ino:<10} Links: {file_stat.st_nlink}\n"
-            output += f"Access: ({oct(stat_module.S_IMODE(mode))}/{perms})  Uid: ({file_stat.st_uid:>5}/{owner:<8}) Gid: ({file_stat.st_gid:>5}/{group:<8})\n"
-            output += f"Access: {access_time}\n"
-            output += f"Modify: {modify_time}\n"
-            output += f"Change: {change_time}\n"
-            output += f" Birth: -"
+            # Build output in one join instead of repeated +=, which
+            # allocates an intermediate string per line.
+            octal_mode = oct(stat_module.S_IMODE(mode))
+            output = '\n'.join((
+                f"  File: {file_path}",
+                f"  Size: {file_stat.st_size:<10} Blocks: {file_stat.st_blocks:<10} IO Block: {file_stat.st_blksize} {file_type}",
+                f"Device: {file_stat.st_dev:x}h/{file_stat.st_dev}d    Inode: {file_stat.st_ino:<10} Links: {file_stat.st_nlink}",
+                f"Access: ({octal_mode}/{perms})  Uid: ({file_stat.st_uid:>5}/{owner:<8}) Gid: ({file_stat.st_gid:>5}/{group:<8})",
+                f"Access: {access_time}",
+                f"Modify: {modify_time}",
+                f"Change: {change_time}",
+                " Birth: -",
+            ))
             
             return {
                 'success': True,
@@ -1026,33 +1469,69 @@ You can also use natural language commands like:
             
             pattern = args[0]
             file_paths = args[1:]
-            results = []
-            
-            for file_path in file_paths:
+            prefix_names = len(file_paths) > 1
+
+            compiled = _compile_grep_pattern(pattern)
+
+            def scan_one(file_path: str) -> List[str]:
                 safe_path = self._safe_path(file_path)
-                
+
                 if not os.path.exists(safe_path):
-                    results.append(f'grep: {file_path}: No such file or directory')
-                    continue
-                
+                    return [f'grep: {file_path}: No such file or directory']
+
                 if os.path.isdir(safe_path):
-                    results.append(f'grep: {file_path}: Is a directory')
-                    continue
-                
+                    return [f'grep: {file_path}: Is a directory']
+
+                matches = []
                 try:
-                    with open(safe_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        line_num = 1
-                        for line in f:
-                            if pattern in line:
-                                if len(file_paths) > 1:
-                                    results.append(f'{file_path}:{line_num}:{line.rstrip()}')
-                                else:
-                                    results.append(f'{line_num}:{line.rstrip()}')
-                            line_num += 1
-                            
+                    # One C-level sweep over the whole buffer, then map
+                    # match offsets to line numbers via a newline index,
+                    # instead of a Python-level loop per line.
+                    buf = _read_file_bytes(safe_path)
+
+                    try:
+                        line_starts = array.array('Q', [0])
+                        pos = buf.find(b'\n')
+                        while pos != -1:
+                            line_starts.append(pos + 1)
+                            pos = buf.find(b'\n', pos + 1)
+
+                        buf_len = len(buf)
+                        n_lines = len(line_starts)
+                        last_line = -1
+                        for m in compiled.finditer(buf):
+                            line_num = bisect.bisect_right(line_starts, m.start())
+                            if line_num == last_line:
+                                continue  # one result per matching line
+                            last_line = line_num
+                            start = line_starts[line_num - 1]
+                            end = line_starts[line_num] - 1 if line_num < n_lines else buf_len
+                            line = buf[start:end].decode('utf-8', errors='ignore').rstrip()
+                            if prefix_names:
+                                matches.append(f'{file_path}:{line_num}:{line}')
+                            else:
+                                matches.append(f'{line_num}:{line}')
+                    finally:
+                        if isinstance(buf, mmap.mmap):
+                            buf.close()
+
                 except Exception as e:
-                    results.append(f'grep: {file_path}: {str(e)}')
-            
+                    matches.append(f'grep: {file_path}: {str(e)}')
+                return matches
+
+            # Independent file scans overlap their reads in a small thread
+            # pool (the one-shot os.read and regex sweep both release the
+            # GIL); ex.map keeps results in argument order. A single file
+            # stays on the calling thread.
+            if prefix_names:
+                workers = min(8, len(file_paths))
+                with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+                    per_file = list(pool.map(scan_one, file_paths))
+            else:
+                per_file = [scan_one(file_paths[0])]
+
+            results = [line for matches in per_file for line in matches]
+
             return {
                 'success': True,
                 'output': '\n'.join(results) if results else '',
@@ -1119,12 +1598,19 @@ You can also use natural language commands like:
                     continue
                 
                 try:
-                    with open(safe_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                        
-                    lines = content.count('\n')
-                    words = len(content.split())
-                    chars = len(content)
+                    content = _read_file_bytes(safe_path)
+
+                    # bytes.count runs as a memchr loop; the word count
+                    # scans match-by-match without building a word list,
+                    # and is skipped entirely when it won't be printed
+                    # (wc -l on a large log is then purely memchr-bound).
+                    try:
+                        lines = content.count(b'\n')
+                        words = sum(1 for _ in _WORD_RE.finditer(content)) if show_words else 0
+                        chars = len(content)
+                    finally:
+                        if isinstance(content, mmap.mmap):
+                            content.close()
                     
                     total_lines += lines
                     total_words += words
@@ -1221,10 +1707,18 @@ You can also use natural language commands like:
                     }
                 
                 try:
-                    with open(safe_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        lines = f.readlines()
-                        all_lines.extend([line.rstrip() for line in lines])
-                        
+                    # One-shot binary read, then a single decode and a
+                    # splitlines C pass instead of a per-line rstrip
+                    # comprehension behind a buffered text reader.
+                    buf = _read_file_bytes(safe_path)
+                    try:
+                        all_lines.extend(
+                            bytes(buf).decode('utf-8', errors='ignore').splitlines()
+                        )
+                    finally:
+                        if isinstance(buf, mmap.mmap):
+                            buf.close()
+
                 except Exception as e:
                     return {
                         'success': False,
@@ -1232,12 +1726,10 @@ You can also use natural language commands like:
                         'error': f'sort: {file_path}: {str(e)}'
                     }
             
-            # Sort the lines
+            # Sort the lines; the numeric key parses each line once with
+            # no throwaway string allocations
             if numeric:
-                try:
-                    all_lines.sort(key=lambda x: float(x) if x.replace('.', '').replace('-', '').isdigit() else float('inf'), reverse=reverse)
-                except:
-                    all_lines.sort(reverse=reverse)
+                all_lines.sort(key=_numeric_sort_key, reverse=reverse)
             else:
                 all_lines.sort(reverse=reverse)
             
@@ -1257,25 +1749,24 @@ You can also use natural language commands like:
     def _handle_ps(self, args: List[str]) -> Dict[str, Any]:
         """Handle ps command - show running processes."""
         try:
-            import psutil
-            processes = []
-            
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
-                try:
-                    processes.append(proc.info)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
-            
-            # Sort by PID
-            processes.sort(key=lambda x: x['pid'])
-            
+            # Only the 20 lowest PIDs are displayed, so select them with a
+            # partial sort — O(N log 20) over the pid list instead of a
+            # full O(N log N) sort — and read /proc for just those.
+            try:
+                pids = heapq.nsmallest(20, (int(name) for name in os.listdir('/proc') if name.isdigit()))
+            except OSError:
+                pids = heapq.nsmallest(20, psutil.pids())
+
             # Format output
             output_lines = ['  PID  %CPU %MEM COMMAND']
-            for proc in processes[:20]:  # Show first 20 processes
-                pid = proc['pid']
-                name = proc['name'][:15]  # Truncate long names
-                cpu = proc['cpu_percent'] or 0
-                mem = proc['memory_percent'] or 0
+            for pid in pids:
+                try:
+                    info = psutil.Process(pid).as_dict(['pid', 'name', 'cpu_percent', 'memory_percent'])
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+                name = (info['name'] or '')[:15]  # Truncate long names
+                cpu = info['cpu_percent'] or 0
+                mem = info['memory_percent'] or 0
                 output_lines.append(f'{pid:5d} {cpu:4.1f} {mem:4.1f} {name}')
             
             return {
@@ -1294,14 +1785,10 @@ You can also use natural language commands like:
     def _handle_uptime(self, args: List[str]) -> Dict[str, Any]:
         """Handle uptime command - show system uptime."""
         try:
-            import time
-            import os
-            
             # Get system uptime
             try:
-                with open('/proc/uptime', 'r') as f:
-                    uptime_seconds = float(f.readline().split()[0])
-            except:
+                uptime_seconds = float(_read_proc_file('/proc/uptime', 64).split(b' ', 1)[0])
+            except (OSError, ValueError):
                 # Fallback for systems without /proc/uptime
                 uptime_seconds = time.time() - os.path.getctime('/proc')
             
@@ -1324,19 +1811,14 @@ You can also use natural language commands like:
             
             # Get load average (if available)
             try:
-                with open('/proc/loadavg', 'r') as f:
-                    load_avg = f.readline().split()[:3]
-                    load_str = f"load average: {', '.join(load_avg)}"
-            except:
+                load_avg = _read_proc_file('/proc/loadavg').decode('ascii').split()[:3]
+                load_str = f"load average: {', '.join(load_avg)}"
+            except OSError:
                 load_str = "load average: N/A"
-            
-            # Get number of users (simplified)
-            try:
-                import subprocess
-                result = subprocess.run(['who'], capture_output=True, text=True, timeout=5)
-                user_count = len(result.stdout.strip().split('\n')) if result.stdout.strip() else 0
-            except:
-                user_count = 1  # assume at least current user
+
+            # Count logged-in users straight from utmp; spawning who(1)
+            # cost a fork+exec per uptime call
+            user_count = _count_logged_in_users()
             
             output = f" {current_time} up {uptime_str}{user_count} user{'s' if user_count != 1 else ''}, {load_str}"
             
@@ -1356,8 +1838,6 @@ You can also use natural language commands like:
     def _handle_disk(self, args: List[str]) -> Dict[str, Any]:
         """Handle disk command - show disk usage information."""
         try:
-            import shutil
-            
             # Default to current directory
             path = self.current_dir
             if args:
@@ -1373,17 +1853,9 @@ You can also use natural language commands like:
             # Get disk usage
             total, used, free = shutil.disk_usage(path)
             
-            # Convert bytes to human readable format
-            def format_bytes(bytes_val):
-                for unit in ['B', 'K', 'M', 'G', 'T']:
-                    if bytes_val < 1024.0:
-                        return f"{bytes_val:.1f}{unit}"
-                    bytes_val /= 1024.0
-                return f"{bytes_val:.1f}P"
-            
-            total_str = format_bytes(total)
-            used_str = format_bytes(used)
-            free_str = format_bytes(free)
+            total_str = _format_bytes(total)
+            used_str = _format_bytes(used)
+            free_str = _format_bytes(free)
             
             # Calculate percentage
             percent_used = (used / total * 100) if total > 0 else 0
@@ -1408,16 +1880,14 @@ You can also use natural language commands like:
     def _handle_env(self, args: List[str]) -> Dict[str, Any]:
         """Handle env command - show environment variables."""
         try:
-            env_vars = []
-            
-            # Show some common environment variables (filtered for security)
-            safe_vars = ['PATH', 'HOME', 'USER', 'SHELL', 'TERM', 'PWD', 'LANG', 'LC_ALL']
-            
-            for var in safe_vars:
-                value = os.environ.get(var, '')
-                if value:
-                    env_vars.append(f'{var}={value}')
-            
+            # One pass over the environment against the frozen whitelist
+            # instead of a per-variable os.environ.get
+            env_vars = [
+                f'{key}={value}'
+                for key, value in os.environ.items()
+                if key in _SAFE_ENV and value
+            ]
+
             # Add some custom variables
             env_vars.extend([
                 'TERMINAL_TYPE=web_terminal',
@@ -1436,4 +1906,11 @@ You can also use natural language commands like:
                 'success': False,
                 'output': '',
                 'error': f'env: {str(e)}'
-            }
\ No newline at end of file
+            }
+# Compiled dispatch table: command name -> plain function, resolved once
+# at import and shared by every instance (handlers are invoked as
+# handler(self, args)).
+_HANDLERS = MappingProxyType({
+    command: getattr(CommandExecutor, name)
+    for command, name in _HANDLER_NAMES.items()
+})
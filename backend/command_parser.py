@@ -7,47 +7,123 @@ import re
 import shlex
 from typing import Dict, List, Any
 
+# Patterns for natural language detection, compiled once into a single
+# alternation so detection is one regex scan instead of a pattern loop.
+_NL_PATTERNS = [
+    r'^(create|make|build)\s+',
+    r'^(show|display|list)\s+',
+    r'^(copy|move|delete|remove)\s+',
+    r'^(find|search|locate)\s+',
+    r'^(how|what|where|when|why)\s+',
+    r'^(can you|could you|please)\s+',
+    r'\s+(please|for me|help)\s*$'
+]
+_NL_RE = re.compile('|'.join(f'(?:{p})' for p in _NL_PATTERNS))
+
+# Dangerous/network patterns for validate_command, one group per pattern
+# so a match's lastindex maps back to the pattern that fired.
+_DANGEROUS_PATTERNS = [
+    r'rm\s+-rf\s+/',  # rm -rf /
+    r'sudo\s+',       # sudo commands
+    r'su\s+',         # su commands
+    r'chmod\s+777',   # dangerous chmod
+    r'>/dev/null',    # output redirection
+    r'&\s*$',         # background processes
+    r'\|\s*sh',       # piping to shell
+    r'`.*`',          # command substitution
+    r'\$\(',          # command substitution
+]
+_DANGER_RE = re.compile('|'.join(f'({p})' for p in _DANGEROUS_PATTERNS), re.IGNORECASE)
+
+_NETWORK_PATTERNS = [r'curl\s+', r'wget\s+', r'nc\s+', r'netcat\s+']
+_NETWORK_RE = re.compile('|'.join(f'({p})' for p in _NETWORK_PATTERNS), re.IGNORECASE)
+
+def _fast_tokenize(user_input: str) -> List[str]:
+    """
+    Tokenize a command line like shlex.split, without building a lexer.
+
+    Unquoted input is a plain str.split; quoted input gets a single-pass
+    scan handling adjacent quoted/unquoted runs. Backslashes are rare in
+    terminal commands, so those inputs fall back to shlex for its full
+    escape semantics. Raises ValueError on an unmatched quote, same as
+    shlex.
+    """
+    if '\\' in user_input:
+        return shlex.split(user_input)
+    if "'" not in user_input and '"' not in user_input:
+        return user_input.split()
+
+    tokens: List[str] = []
+    buf: List[str] = []
+    in_token = False
+    i = 0
+    n = len(user_input)
+    find = user_input.find
+    while i < n:
+        c = user_input[i]
+        if c in ' \t\r\n':
+            if in_token:
+                tokens.append(''.join(buf))
+                buf.clear()
+                in_token = False
+            i += 1
+        elif c == "'" or c == '"':
+            end = find(c, i + 1)
+            if end < 0:
+                raise ValueError('No closing quotation')
+            buf.append(user_input[i + 1:end])
+            in_token = True
+            i = end + 1
+        else:
+            j = i + 1
+            while j < n and user_input[j] not in ' \t\r\n\'"':
+                j += 1
+            buf.append(user_input[i:j])
+            in_token = True
+            i = j
+    if in_token:
+        tokens.append(''.join(buf))
+    return tokens
+
 class CommandParser:
     """
     Parses user input and determines if it's a direct command or natural language.
     """
     
+    # Known terminal commands, shared by every instance
+    TERMINAL_COMMANDS = frozenset({
+        # File operations
+        'ls', 'pwd', 'cd', 'mkdir', 'rmdir', 'rm', 'cp', 'mv', 'touch',
+        'cat', 'head', 'tail', 'find', 'tree', 'stat',
+
+        # Text operations
+        'echo', 'grep', 'wc', 'sort', 'diff', 'sed', 'awk',
+
+        # System monitoring
+        'system', 'top', 'ps', 'uptime', 'disk', 'net', 'who', 'env',
+
+        # Network commands
+        'ping', 'curl', 'wget', 'nslookup', 'ifconfig', 'ip', 'traceroute',
+
+        # Process management
+        'kill', 'killall', 'bg', 'fg',
+
+        # Package management
+        'pip',
+
+        # Utility commands
+        'history', 'clear', 'date', 'cal', 'alias', 'exit', 'quit', 'help'
+    })
+
+    # Question-word prefixes (trailing space so 'whoami'/'whole' don't
+    # false-positive); str.startswith takes the tuple in one C call.
+    QUESTION_PREFIXES = ('how ', 'what ', 'where ', 'when ', 'why ', 'which ', 'who ')
+
     def __init__(self):
-        # Define known terminal commands
-        self.terminal_commands = {
-            # File operations
-            'ls', 'pwd', 'cd', 'mkdir', 'rmdir', 'rm', 'cp', 'mv', 'touch',
-            'cat', 'head', 'tail', 'find', 'tree', 'stat',
-            
-            # Text operations
-            'echo', 'grep', 'wc', 'sort', 'diff', 'sed', 'awk',
-            
-            # System monitoring
-            'system', 'top', 'ps', 'uptime', 'disk', 'net', 'who', 'env',
-            
-            # Network commands
-            'ping', 'curl', 'wget', 'nslookup', 'ifconfig', 'ip', 'traceroute',
-            
-            # Process management
-            'kill', 'killall', 'bg', 'fg',
-            
-            # Package management
-            'pip',
-            
-            # Utility commands
-            'history', 'clear', 'date', 'cal', 'alias', 'exit', 'quit', 'help'
-        }
-        
-        # Patterns for natural language detection
-        self.natural_language_patterns = [
-            r'^(create|make|build)\s+',
-            r'^(show|display|list)\s+',
-            r'^(copy|move|delete|remove)\s+',
-            r'^(find|search|locate)\s+',
-            r'^(how|what|where|when|why)\s+',
-            r'^(can you|could you|please)\s+',
-            r'\s+(please|for me|help)\s*$'
-        ]
+        self.terminal_commands = self.TERMINAL_COMMANDS
+
+        # Patterns for natural language detection (precompiled alternation)
+        self.natural_language_patterns = _NL_PATTERNS
     
     def parse(self, user_input: str) -> Dict[str, Any]:
         """
@@ -72,9 +148,10 @@ class CommandParser:
         # Check if it's a direct terminal command
         if self._is_terminal_command(user_input):
             return self._parse_terminal_command(user_input)
-        
-        # Check if it's natural language
-        if self._is_natural_language(user_input):
+
+        # Check if it's natural language; the command check above already
+        # failed, so tell the helper not to repeat it
+        if self._is_natural_language(user_input, is_command=False):
             return {
                 'type': 'natural_language',
                 'command': user_input,
@@ -95,46 +172,44 @@ class CommandParser:
         Returns:
             bool: True if it's a terminal command
         """
-        try:
-            # Split the input into tokens
-            tokens = shlex.split(user_input)
-            if not tokens:
-                return False
-            
-            # Check if the first token is a known command
-            command = tokens[0].lower()
-            return command in self.terminal_commands
-        except ValueError:
-            # Handle shell parsing errors (unmatched quotes, etc.)
+        # Only the first token matters here, and command names never
+        # contain quoting, so a plain whitespace split avoids running
+        # the shlex tokenizer over the whole input.
+        parts = user_input.split(None, 1)
+        if not parts:
             return False
+        return parts[0].lower() in self.TERMINAL_COMMANDS
     
-    def _is_natural_language(self, user_input: str) -> bool:
+    def _is_natural_language(self, user_input: str, is_command: bool = None) -> bool:
         """
         Check if the input appears to be natural language.
-        
+
         Args:
             user_input (str): User input to check
-            
+            is_command (bool): Result of _is_terminal_command when the
+                caller already knows it, so it isn't recomputed here
+
         Returns:
             bool: True if it appears to be natural language
         """
         user_input_lower = user_input.lower()
-        
-        # Check against natural language patterns
-        for pattern in self.natural_language_patterns:
-            if re.search(pattern, user_input_lower):
-                return True
-        
-        # Check for question words
-        question_words = ['how', 'what', 'where', 'when', 'why', 'which', 'who']
-        if any(user_input_lower.startswith(word) for word in question_words):
+
+        # Check against natural language patterns in one scan
+        if _NL_RE.search(user_input_lower):
             return True
         
-        # Check for sentence-like structure (multiple words with spaces)
-        words = user_input.split()
-        if len(words) > 3 and not self._is_terminal_command(user_input):
+        # Check for question words
+        if user_input_lower.startswith(self.QUESTION_PREFIXES):
             return True
-        
+
+        # Check for sentence-like structure; counting spaces approximates
+        # the word count without materializing a list of words
+        if user_input.count(' ') > 3:
+            if is_command is None:
+                is_command = self._is_terminal_command(user_input)
+            if not is_command:
+                return True
+
         return False
     
     def _parse_terminal_command(self, user_input: str) -> Dict[str, Any]:
@@ -148,8 +223,8 @@ class CommandParser:
             Dict containing parsed command information
         """
         try:
-            # Use shlex to properly handle quoted arguments
-            tokens = shlex.split(user_input)
+            # Quote-aware tokenization without shlex's per-call lexer
+            tokens = _fast_tokenize(user_input)
             if not tokens:
                 return {
                     'type': 'empty',
@@ -194,39 +269,27 @@ class CommandParser:
             'errors': []
         }
         
-        # Check for potentially dangerous commands
-        dangerous_patterns = [
-            r'rm\s+-rf\s+/',  # rm -rf /
-            r'sudo\s+',       # sudo commands
-            r'su\s+',         # su commands
-            r'chmod\s+777',   # dangerous chmod
-            r'>/dev/null',    # output redirection
-            r'&\s*$',         # background processes
-            r'\|\s*sh',       # piping to shell
-            r'`.*`',          # command substitution
-            r'\$\(',          # command substitution
-        ]
-        
-        for pattern in dangerous_patterns:
-            if re.search(pattern, command, re.IGNORECASE):
-                validation_result['warnings'].append(
-                    f"Potentially dangerous pattern detected: {pattern}"
-                )
-        
+        # Check for potentially dangerous commands; the combined regex
+        # scans the input once, and lastindex maps each hit back to the
+        # pattern that fired (one warning per pattern, in pattern order).
+        dangerous_hits = {m.lastindex for m in _DANGER_RE.finditer(command)}
+        for index in sorted(dangerous_hits):
+            validation_result['warnings'].append(
+                f"Potentially dangerous pattern detected: {_DANGEROUS_PATTERNS[index - 1]}"
+            )
+
         # Check for path traversal attempts
         if '../' in command or '/..' in command:
             validation_result['warnings'].append(
                 "Path traversal attempt detected"
             )
-        
+
         # Check for network access attempts
-        network_patterns = [r'curl\s+', r'wget\s+', r'nc\s+', r'netcat\s+']
-        for pattern in network_patterns:
-            if re.search(pattern, command, re.IGNORECASE):
-                validation_result['warnings'].append(
-                    "Network access command detected"
-                )
-        
+        network_hits = {m.lastindex for m in _NETWORK_RE.finditer(command)}
+        validation_result['warnings'].extend(
+            "Network access command detected" for _ in network_hits
+        )
+
         return validation_result
     
     def get_command_help(self, command: str) -> str:
@@ -3,15 +3,53 @@ Database Manager Module
 Handles Supabase database operations for user management, command history, and sessions.
 """
 
+import atexit
 import os
-from datetime import datetime
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Any, Optional
+import httpx
+from postgrest.utils import SyncClient
 from supabase import create_client, Client
+from supabase.lib.client_options import ClientOptions
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Bound every Supabase call; with threading-mode SocketIO a stalled
+# request would otherwise pin a worker thread for the library's default
+# two minutes.
+_REQUEST_TIMEOUT = 10
+
+# Keep idle connections to Supabase alive well past httpx's 5s default
+# so commands arriving seconds apart reuse the TCP+TLS session instead
+# of re-handshaking.
+_KEEPALIVE_EXPIRY = 60.0
+
+# Command-history batching: rows queue in process and flush as one
+# insert per interval (or sooner once a full batch accumulates), so the
+# hot command path never waits on a Supabase round-trip per row.
+_HISTORY_FLUSH_INTERVAL = 1.0
+_HISTORY_FLUSH_BATCH = 500
+_HISTORY_MAX_BACKOFF = 30.0
+
+# get_user results are near-immutable (the UUID never changes), so
+# successful lookups are cached in-process for this long.
+_USER_CACHE_TTL = 300.0
+_USER_CACHE_MAX = 10_000
+
+# Successful health probes stay valid for this long.
+_HEALTH_CACHE_TTL = 1.0
+
+# Session heartbeats are debounced: update_session_activity only marks
+# the session dirty, and a background thread writes each dirty session
+# once per interval no matter how many commands arrived in between.
+_SESSION_FLUSH_INTERVAL = 5.0
+
 class DatabaseManager:
     """
     Manages all database operations with Supabase.
@@ -25,20 +63,168 @@ class DatabaseManager:
         if not self.supabase_url or not self.supabase_key:
             raise ValueError("SUPABASE_URL and SUPABASE_API_KEY must be set in environment variables")
         
-        self.supabase: Client = create_client(self.supabase_url, self.supabase_key)
-    
+        # The bundled postgrest transport already multiplexes every
+        # call over a keep-alive httpx pool; only the timeout needs
+        # tightening here.
+        self.supabase: Client = create_client(
+            self.supabase_url, self.supabase_key,
+            options=ClientOptions(postgrest_client_timeout=_REQUEST_TIMEOUT)
+        )
+
+        # Rebuild the REST session with a longer keepalive window (httpx
+        # drops idle connections after 5s by default, forcing a fresh
+        # TLS handshake per burst of commands). Gzip response encoding
+        # is already negotiated by httpx's default Accept-Encoding.
+        # HTTP/1.1 only: http2=True needs the optional h2 package,
+        # which isn't in requirements, and keep-alive is the win here.
+        default_session = self.supabase.postgrest.session
+        self.supabase.postgrest.session = SyncClient(
+            base_url=default_session.base_url,
+            headers=default_session.headers,
+            timeout=_REQUEST_TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                keepalive_expiry=_KEEPALIVE_EXPIRY,
+            ),
+        )
+        default_session.close()
+
+        # Table request builders are stateless (session + path) and every
+        # verb returns a fresh query builder, so build each once and share
+        # the client's keep-alive HTTP session across all calls.
+        self._users = self.supabase.table('users')
+        self._sessions = self.supabase.table('sessions')
+        self._history = self.supabase.table('command_history')
+        self._logs = self.supabase.table('logs')
+
+        # Queued history rows plus the daemon thread that flushes them.
+        self._hist_queue: deque = deque()
+        self._hist_lock = threading.Lock()
+        self._hist_wake = threading.Event()
+        self._hist_backoff = _HISTORY_FLUSH_INTERVAL
+        self._hist_thread = threading.Thread(
+            target=self._history_flush_loop, name='history-flush', daemon=True
+        )
+        self._hist_thread.start()
+        atexit.register(self._flush_history_now)
+
+        # Anonymous-user UUID, resolved once per process (see
+        # _resolve_anon_user); the lock keeps create-if-missing idempotent.
+        self._anon_user_id: Optional[str] = None
+        self._anon_lock = threading.Lock()
+
+        # TTL cache of successful get_user results, keyed by
+        # (user_id, username); turns repeat lookups into dict hits.
+        self._user_cache: Dict[Any, Any] = {}
+        self._user_cache_lock = threading.Lock()
+
+        # Monotonic time of the last successful health probe.
+        self._health_ok_at = -_HEALTH_CACHE_TTL
+
+        # Dirty session heartbeats, flushed by a debouncing thread.
+        self._session_dirty: Dict[str, str] = {}
+        self._session_lock = threading.Lock()
+        self._session_thread = threading.Thread(
+            target=self._session_flush_loop, name='session-flush', daemon=True
+        )
+        self._session_thread.start()
+        atexit.register(self._flush_session_activity)
+
+    def _session_flush_loop(self):
+        """Write out dirty session heartbeats once per interval."""
+        while True:
+            time.sleep(_SESSION_FLUSH_INTERVAL)
+            self._flush_session_activity()
+
+    def _flush_session_activity(self):
+        """Flush pending last_activity updates, one write per session."""
+        with self._session_lock:
+            if not self._session_dirty:
+                return
+            dirty = self._session_dirty
+            self._session_dirty = {}
+        for session_id, last_activity in dirty.items():
+            try:
+                self._sessions.update({
+                    'last_activity': last_activity
+                }, returning='minimal').eq('session_id', session_id).execute()
+            except Exception as e:
+                print(f"Warning: Failed to flush session activity: {e}")
+
+    def _resolve_anon_user(self) -> Optional[str]:
+        """
+        Return the anonymous user's UUID, resolving it at most once.
+
+        The first caller looks up (or creates) the 'anonymous' user row;
+        the result is memoized so subsequent commands skip the extra
+        round-trip entirely.
+        """
+        if self._anon_user_id is not None:
+            return self._anon_user_id
+        with self._anon_lock:
+            if self._anon_user_id is not None:
+                return self._anon_user_id
+            anon_user = self.get_user(username='anonymous')
+            if anon_user['success']:
+                self._anon_user_id = anon_user['user']['id']
+            else:
+                create_result = self.create_user('anonymous', 'anonymous@localhost')
+                if create_result['success']:
+                    self._anon_user_id = create_result['user']['id']
+            return self._anon_user_id
+
+    def _history_flush_loop(self):
+        """Flush queued history rows every interval (or when woken early)."""
+        while True:
+            self._hist_wake.wait(self._hist_backoff)
+            self._hist_wake.clear()
+            self._flush_history_now()
+
+    def _flush_history_now(self):
+        """Insert all queued history rows in batched requests."""
+        while True:
+            rows = []
+            with self._hist_lock:
+                while self._hist_queue and len(rows) < _HISTORY_FLUSH_BATCH:
+                    rows.append(self._hist_queue.popleft())
+            if not rows:
+                return
+            try:
+                # One multi-row INSERT per batch, planned once server
+                # side; minimal return skips echoing the rows back
+                self._history.insert(rows, returning='minimal').execute()
+                self._hist_backoff = _HISTORY_FLUSH_INTERVAL
+            except Exception as e:
+                # Re-queue in original order and back off before retrying
+                print(f"Warning: Failed to flush command history batch: {e}")
+                with self._hist_lock:
+                    self._hist_queue.extendleft(reversed(rows))
+                self._hist_backoff = min(self._hist_backoff * 2, _HISTORY_MAX_BACKOFF)
+                return
+
     def initialize_tables(self):
         """
         Initialize database tables if they don't exist.
         This method checks if tables exist and creates them if needed.
         """
         try:
-            # Check if tables exist by trying to query them
-            self._check_and_create_users_table()
-            self._check_and_create_sessions_table()
-            self._check_and_create_command_history_table()
-            self._check_and_create_logs_table()
-            
+            # Probe all four tables concurrently; startup then waits one
+            # round-trip instead of four sequential ones
+            checks = (
+                self._check_and_create_users_table,
+                self._check_and_create_sessions_table,
+                self._check_and_create_command_history_table,
+                self._check_and_create_logs_table,
+            )
+            with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+                for future in [pool.submit(check) for check in checks]:
+                    future.result()
+
+            # Warm the anonymous-user cache so the first command doesn't
+            # pay the lookup.
+            self._resolve_anon_user()
+
             print("Database tables initialized successfully")
             
         except Exception as e:
@@ -50,7 +236,7 @@ class DatabaseManager:
         """Check and create users table."""
         try:
             # Try to select from users table
-            result = self.supabase.table('users').select('id').limit(1).execute()
+            result = self._users.select('id').limit(1).execute()
         except Exception:
             # Table doesn't exist, log this for manual creation
             print("Users table not found. Please create it manually in Supabase with:")
@@ -69,7 +255,7 @@ class DatabaseManager:
     def _check_and_create_sessions_table(self):
         """Check and create sessions table."""
         try:
-            result = self.supabase.table('sessions').select('id').limit(1).execute()
+            result = self._sessions.select('id').limit(1).execute()
         except Exception:
             print("Sessions table not found. Please create it manually in Supabase with:")
             print("""
@@ -87,12 +273,15 @@ class DatabaseManager:
     def _check_and_create_command_history_table(self):
         """Check and create command_history table."""
         try:
-            result = self.supabase.table('command_history').select('id').limit(1).execute()
+            result = self._history.select('id').limit(1).execute()
         except Exception:
             print("Command history table not found. Please create it manually in Supabase with:")
             print("""
+            -- Partitioned by month so old history is removed by dropping
+            -- a partition (a catalog change) instead of a bulk DELETE
+            -- that rewrites WAL and needs VACUUM afterwards.
             CREATE TABLE command_history (
-                id UUID DEFAULT uuid_generate_v4() PRIMARY KEY,
+                id UUID DEFAULT uuid_generate_v4(),
                 user_id UUID REFERENCES users(id) ON DELETE CASCADE,
                 session_id VARCHAR(100) NOT NULL,
                 command TEXT NOT NULL,
@@ -101,18 +290,25 @@ class DatabaseManager:
                 execution_time_ms INTEGER,
                 created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
                 command_type VARCHAR(50) DEFAULT 'terminal',
-                metadata JSONB DEFAULT '{}'
-            );
-            
+                metadata JSONB DEFAULT '{}',
+                PRIMARY KEY (id, created_at)
+            ) PARTITION BY RANGE (created_at);
+
+            -- One child partition per month, e.g.:
+            CREATE TABLE command_history_202608 PARTITION OF command_history
+                FOR VALUES FROM ('2026-08-01') TO ('2026-09-01');
+            -- Expire old months with: DROP TABLE command_history_YYYYMM;
+
             CREATE INDEX idx_command_history_user_id ON command_history(user_id);
             CREATE INDEX idx_command_history_session_id ON command_history(session_id);
             CREATE INDEX idx_command_history_created_at ON command_history(created_at);
+            CREATE INDEX idx_command_history_user_created ON command_history(user_id, created_at DESC);
             """)
     
     def _check_and_create_logs_table(self):
         """Check and create logs table."""
         try:
-            result = self.supabase.table('logs').select('id').limit(1).execute()
+            result = self._logs.select('id').limit(1).execute()
         except Exception:
             print("Logs table not found. Please create it manually in Supabase with:")
             print("""
@@ -143,16 +339,22 @@ class DatabaseManager:
             Dict containing user information or error
         """
         try:
+            # This insert keeps the default representation return: the
+            # caller needs the server-assigned UUID (the anonymous
+            # bootstrap caches it afterwards). Fire-and-forget inserts
+            # (history, logs) use returning='minimal' instead.
+            # created_at comes from the column's DEFAULT NOW()
             user_data = {
                 'username': username,
                 'email': email,
-                'created_at': datetime.now().isoformat(),
                 'is_active': True
             }
             
-            result = self.supabase.table('users').insert(user_data).execute()
-            
+            result = self._users.insert(user_data).execute()
+
             if result.data:
+                with self._user_cache_lock:
+                    self._user_cache.clear()
                 return {
                     'success': True,
                     'user': result.data[0]
@@ -180,25 +382,37 @@ class DatabaseManager:
         Returns:
             Dict containing user information or error
         """
+        cache_key = (user_id, username)
+        now = time.monotonic()
+        with self._user_cache_lock:
+            cached = self._user_cache.get(cache_key)
+            if cached is not None and now < cached[1]:
+                return {'success': True, 'user': cached[0]}
+
         try:
             if user_id:
-                result = self.supabase.table('users').select('*').eq('id', user_id).execute()
+                result = self._users.select('*').eq('id', user_id).execute()
             elif username:
-                result = self.supabase.table('users').select('*').eq('username', username).execute()
+                result = self._users.select('*').eq('username', username).execute()
             else:
                 return {'success': False, 'error': 'Either user_id or username must be provided'}
-            
+
             if result.data:
+                user = result.data[0]
+                with self._user_cache_lock:
+                    if len(self._user_cache) >= _USER_CACHE_MAX:
+                        self._user_cache.clear()
+                    self._user_cache[cache_key] = (user, now + _USER_CACHE_TTL)
                 return {
                     'success': True,
-                    'user': result.data[0]
+                    'user': user
                 }
             else:
                 return {
                     'success': False,
                     'error': 'User not found'
                 }
-                
+
         except Exception as e:
             return {
                 'success': False,
@@ -216,14 +430,15 @@ class DatabaseManager:
             Dict containing success status
         """
         try:
-            result = self.supabase.table('users').update({
+            # return=minimal: no need to ship the updated row back
+            self._users.update({
                 'last_login': datetime.now().isoformat()
-            }).eq('id', user_id).execute()
-            
-            return {
-                'success': True,
-                'updated': len(result.data) > 0
-            }
+            }, returning='minimal').eq('id', user_id).execute()
+
+            with self._user_cache_lock:
+                self._user_cache.clear()
+
+            return {'success': True}
             
         except Exception as e:
             return {
@@ -244,15 +459,15 @@ class DatabaseManager:
             Dict containing session information or error
         """
         try:
+            # created_at/last_activity come from the columns' DEFAULT
+            # NOW(), set atomically with the insert
             session_data = {
                 'user_id': user_id,
                 'session_id': session_id,
-                'created_at': datetime.now().isoformat(),
-                'last_activity': datetime.now().isoformat(),
                 'is_active': True
             }
             
-            result = self.supabase.table('sessions').insert(session_data).execute()
+            result = self._sessions.insert(session_data).execute()
             
             if result.data:
                 return {
@@ -274,28 +489,20 @@ class DatabaseManager:
     def update_session_activity(self, session_id: str) -> Dict[str, Any]:
         """
         Update session's last activity timestamp.
-        
+
+        Heartbeats are debounced: this only records the timestamp in
+        memory, and the background flusher writes each dirty session at
+        most once per interval.
+
         Args:
             session_id (str): Session ID
-            
+
         Returns:
             Dict containing success status
         """
-        try:
-            result = self.supabase.table('sessions').update({
-                'last_activity': datetime.now().isoformat()
-            }).eq('session_id', session_id).execute()
-            
-            return {
-                'success': True,
-                'updated': len(result.data) > 0
-            }
-            
-        except Exception as e:
-            return {
-                'success': False,
-                'error': str(e)
-            }
+        with self._session_lock:
+            self._session_dirty[session_id] = datetime.now().isoformat()
+        return {'success': True}
     
     def close_session(self, session_id: str) -> Dict[str, Any]:
         """
@@ -308,14 +515,11 @@ class DatabaseManager:
             Dict containing success status
         """
         try:
-            result = self.supabase.table('sessions').update({
+            self._sessions.update({
                 'is_active': False
-            }).eq('session_id', session_id).execute()
-            
-            return {
-                'success': True,
-                'closed': len(result.data) > 0
-            }
+            }, returning='minimal').eq('session_id', session_id).execute()
+
+            return {'success': True}
             
         except Exception as e:
             return {
@@ -324,10 +528,11 @@ class DatabaseManager:
             }
     
     # Command History Management
-    def save_command_history(self, user_id: str, session_id: str, command: str, 
-                           output: str, success: bool = True, 
+    def save_command_history(self, user_id: str, session_id: str, command: str,
+                           output: str, success: bool = True,
                            execution_time_ms: Optional[int] = None,
-                           command_type: str = 'terminal') -> Dict[str, Any]:
+                           command_type: str = 'terminal',
+                           created_at: Optional[str] = None) -> Dict[str, Any]:
         """
         Save command execution to history.
         
@@ -339,44 +544,52 @@ class DatabaseManager:
             success (bool): Whether command succeeded
             execution_time_ms (Optional[int]): Execution time in milliseconds
             command_type (str): Type of command (terminal, natural_language, etc.)
+            created_at (Optional[str]): ISO timestamp computed by the
+                caller; defaults to now so it is formatted only once
+                per command
             
         Returns:
             Dict containing success status
         """
         try:
-            # For anonymous users, use a special user ID
+            # For anonymous users, use the cached anonymous-user UUID
             if user_id == 'anonymous':
-                # Try to get or create anonymous user
-                anon_user = self.get_user(username='anonymous')
-                if not anon_user['success']:
-                    # Create anonymous user
-                    create_result = self.create_user('anonymous', 'anonymous@localhost')
-                    if create_result['success']:
-                        user_id = create_result['user']['id']
-                    else:
-                        # Skip database save for true anonymous users
-                        return {'success': True, 'message': 'Command executed but not saved (anonymous user)'}
-                else:
-                    user_id = anon_user['user']['id']
-            
+                user_id = self._resolve_anon_user()
+                if user_id is None:
+                    # Skip database save for true anonymous users
+                    return {'success': True, 'message': 'Command executed but not saved (anonymous user)'}
+            
+            # Limit output size; slice only when actually over the limit
+            # so small outputs (the common case) aren't copied
+            if output is None:
+                output = ''
+            elif len(output) > 10000:
+                output = output[:10000]
+
             history_data = {
                 'user_id': user_id,
                 'session_id': session_id,
                 'command': command,
-                'output': output[:10000] if output else '',  # Limit output size
+                'output': output,
                 'success': success,
                 'execution_time_ms': execution_time_ms,
                 'command_type': command_type,
-                'created_at': datetime.now().isoformat()
+                'created_at': created_at or datetime.now().isoformat()
             }
-            
-            result = self.supabase.table('command_history').insert(history_data).execute()
-            
+
+            # Queue for the background flusher instead of paying a
+            # Supabase round-trip per command.
+            with self._hist_lock:
+                self._hist_queue.append(history_data)
+                queued = len(self._hist_queue)
+            if queued >= _HISTORY_FLUSH_BATCH:
+                self._hist_wake.set()
+
             return {
                 'success': True,
-                'saved': len(result.data) > 0
+                'queued': True
             }
-            
+
         except Exception as e:
             # Don't fail the command execution if history saving fails
             print(f"Warning: Failed to save command history: {e}")
@@ -386,54 +599,133 @@ class DatabaseManager:
                 'message': 'Command executed but history not saved'
             }
     
-    def get_command_history(self, user_id: str = None, session_id: str = None, 
-                          limit: int = 50) -> List[Dict[str, Any]]:
+    def get_command_history(self, user_id: str = None, session_id: str = None,
+                          limit: int = 50, before: str = None) -> List[Dict[str, Any]]:
         """
         Get command history for a user or session.
-        
+
         Args:
             user_id (str): User ID
             session_id (str): Session ID
             limit (int): Maximum number of records to return
-            
+            before (str): Keyset cursor; only return rows created before
+                this ISO timestamp (the last row's created_at from the
+                previous page)
+
         Returns:
-            List of command history records
+            List of command history records (without the output blob;
+            use get_command_output for drilldown)
         """
         try:
-            query = self.supabase.table('command_history').select('*')
-            
+            # Project only what the history view renders — shipping the
+            # 10KB output blobs here dominated response size — and embed
+            # the related user and session so callers get them in the
+            # same request instead of one lookup per row
+            query = self._history.select(
+                'id,command,success,execution_time_ms,command_type,created_at,'
+                ' user:users(username,email), session:sessions(metadata,last_activity)'
+            )
+
             if user_id and user_id != 'anonymous':
                 query = query.eq('user_id', user_id)
             elif session_id:
                 query = query.eq('session_id', session_id)
-            
+
+            if before:
+                # Keyset pagination: cheaper than OFFSET for deep pages
+                query = query.lt('created_at', before)
+
             result = query.order('created_at', desc=True).limit(limit).execute()
-            
+
             return result.data if result.data else []
-            
+
         except Exception as e:
             print(f"Error getting command history: {e}")
             return []
+
+    def iter_command_history(self, user_id: str = None, session_id: str = None,
+                             chunk: int = 500):
+        """
+        Iterate over the full command history one page at a time.
+
+        Pages through get_command_history with its keyset cursor, so
+        memory stays bounded to one chunk no matter how many rows exist
+        and callers (e.g. a history export) can stream rows out as they
+        arrive.
+
+        Args:
+            user_id (str): User ID
+            session_id (str): Session ID
+            chunk (int): Rows fetched per request
+
+        Yields:
+            Command history records, newest first
+        """
+        before = None
+        while True:
+            page = self.get_command_history(
+                user_id=user_id, session_id=session_id,
+                limit=chunk, before=before
+            )
+            if not page:
+                return
+            yield from page
+            before = page[-1]['created_at']
+            if len(page) < chunk:
+                return
+
+    def get_command_output(self, history_id: str) -> Dict[str, Any]:
+        """
+        Get the full stored output for a single history entry.
+
+        Args:
+            history_id (str): Command history record ID
+
+        Returns:
+            Dict containing success status and the output text
+        """
+        try:
+            result = self._history.select('id,output').eq('id', history_id).limit(1).execute()
+
+            if result.data:
+                return {'success': True, 'output': result.data[0].get('output', '')}
+            return {'success': False, 'error': 'History entry not found'}
+
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
     
     def delete_old_history(self, days_old: int = 30) -> Dict[str, Any]:
         """
         Delete command history older than specified days.
-        
+
+        On a partitioned command_history table (see the DDL advice in
+        _check_and_create_command_history_table) prefer dropping expired
+        monthly partitions server-side; this row-level DELETE is the
+        fallback for unpartitioned deployments.
+
         Args:
             days_old (int): Number of days after which to delete history
-            
+
         Returns:
             Dict containing deletion results
         """
         try:
-            cutoff_date = datetime.now().timestamp() - (days_old * 24 * 60 * 60)
-            cutoff_iso = datetime.fromtimestamp(cutoff_date).isoformat()
-            
-            result = self.supabase.table('command_history').delete().lt('created_at', cutoff_iso).execute()
-            
+            # Aware UTC cutoff: the ISO string carries its offset, so
+            # the server compares it against the timestamptz column
+            # unambiguously regardless of this process's local timezone
+            cutoff_iso = (datetime.now(timezone.utc) - timedelta(days=days_old)).isoformat()
+            
+            # Count the matching rows with a head request, then delete
+            # with return=minimal so no deleted rows travel back
+            count_result = self._history.select(
+                'id', count='exact', head=True
+            ).lt('created_at', cutoff_iso).execute()
+
+            self._history.delete(returning='minimal').lt('created_at', cutoff_iso).execute()
+
             return {
                 'success': True,
-                'deleted_count': len(result.data) if result.data else 0
+                'deleted_count': count_result.count or 0
             }
             
         except Exception as e:
@@ -444,7 +736,8 @@ class DatabaseManager:
     
     # Logging
     def log_event(self, level: str, message: str, user_id: Optional[str] = None,
-                  session_id: Optional[str] = None, metadata: Optional[Dict] = None) -> Dict[str, Any]:
+                  session_id: Optional[str] = None, metadata: Optional[Dict] = None,
+                  created_at: Optional[str] = None) -> Dict[str, Any]:
         """
         Log an event to the logs table.
         
@@ -454,7 +747,9 @@ class DatabaseManager:
             user_id (Optional[str]): User ID
             session_id (Optional[str]): Session ID
             metadata (Optional[Dict]): Additional metadata
-            
+            created_at (Optional[str]): ISO timestamp computed by the
+                caller; defaults to now
+
         Returns:
             Dict containing success status
         """
@@ -464,15 +759,19 @@ class DatabaseManager:
                 'message': message,
                 'user_id': user_id,
                 'session_id': session_id,
-                'metadata': metadata or {},
-                'created_at': datetime.now().isoformat()
+                'created_at': created_at or datetime.now().isoformat()
             }
+            # Most events carry no metadata; omitting the key lets the
+            # column's JSONB DEFAULT '{}' fill it without serializing
+            # (or shipping) an empty object per event
+            if metadata:
+                log_data['metadata'] = metadata
             
-            result = self.supabase.table('logs').insert(log_data).execute()
-            
+            self._logs.insert(log_data, returning='minimal').execute()
+
             return {
                 'success': True,
-                'logged': len(result.data) > 0
+                'logged': True
             }
             
         except Exception as e:
@@ -494,8 +793,9 @@ class DatabaseManager:
             List of log records
         """
         try:
-            query = self.supabase.table('logs').select('*')
-            
+            # Log views only render these columns; skip metadata payloads
+            query = self._logs.select('id,level,message,created_at')
+
             if level:
                 query = query.eq('level', level.upper())
             
@@ -511,20 +811,33 @@ class DatabaseManager:
     def health_check(self) -> Dict[str, Any]:
         """
         Check database connectivity and health.
-        
+
+        Successful probes are cached for a second so liveness checks
+        hammering this endpoint don't each hit Supabase; the probe
+        itself is a bodiless head request.
+
         Returns:
             Dict containing health status
         """
+        now = time.monotonic()
+        if now - self._health_ok_at < _HEALTH_CACHE_TTL:
+            return {
+                'success': True,
+                'message': 'Database connection healthy',
+                'timestamp': datetime.now().isoformat()
+            }
+
         try:
-            # Try a simple query to check connectivity
-            result = self.supabase.table('users').select('id').limit(1).execute()
-            
+            # head=True: connectivity proof without shipping a row back
+            self._users.select('id', head=True).limit(1).execute()
+            self._health_ok_at = now
+
             return {
                 'success': True,
                 'message': 'Database connection healthy',
                 'timestamp': datetime.now().isoformat()
             }
-            
+
         except Exception as e:
             return {
                 'success': False,
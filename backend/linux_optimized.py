@@ -0,0 +1,85 @@
+"""
+Linux-specific syscall helpers.
+
+statx(2) can request only the file-type bits and pass AT_STATX_DONT_SYNC,
+which lets the kernel answer from cached metadata instead of forcing a
+sync on network/overlay filesystems — much cheaper than a full stat when
+a caller only needs "is this a directory?". Falls back cleanly where
+libc or the syscall is unavailable (non-Linux, kernels before 4.11).
+"""
+
+import ctypes
+import os
+
+AT_FDCWD = -100
+AT_SYMLINK_NOFOLLOW = 0x100
+AT_STATX_DONT_SYNC = 0x4000
+STATX_TYPE = 0x0001
+
+S_IFMT = 0o170000
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ('tv_sec', ctypes.c_longlong),
+        ('tv_nsec', ctypes.c_uint32),
+        ('_reserved', ctypes.c_int32),
+    ]
+
+class _Statx(ctypes.Structure):
+    _fields_ = [
+        ('stx_mask', ctypes.c_uint32),
+        ('stx_blksize', ctypes.c_uint32),
+        ('stx_attributes', ctypes.c_uint64),
+        ('stx_nlink', ctypes.c_uint32),
+        ('stx_uid', ctypes.c_uint32),
+        ('stx_gid', ctypes.c_uint32),
+        ('stx_mode', ctypes.c_uint16),
+        ('_spare0', ctypes.c_uint16),
+        ('stx_ino', ctypes.c_uint64),
+        ('stx_size', ctypes.c_uint64),
+        ('stx_blocks', ctypes.c_uint64),
+        ('stx_attributes_mask', ctypes.c_uint64),
+        ('stx_atime', _StatxTimestamp),
+        ('stx_btime', _StatxTimestamp),
+        ('stx_ctime', _StatxTimestamp),
+        ('stx_mtime', _StatxTimestamp),
+        ('stx_rdev_major', ctypes.c_uint32),
+        ('stx_rdev_minor', ctypes.c_uint32),
+        ('stx_dev_major', ctypes.c_uint32),
+        ('stx_dev_minor', ctypes.c_uint32),
+        ('stx_mnt_id', ctypes.c_uint64),
+        ('_spare2', ctypes.c_uint64),
+        ('_spare3', ctypes.c_uint64 * 12),
+    ]
+
+# Probe libc.statx once at import; any failure disables the fast path.
+_statx = None
+try:
+    _libc = ctypes.CDLL('libc.so.6', use_errno=True)
+    _statx = _libc.statx
+    _statx.argtypes = [
+        ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint,
+        ctypes.POINTER(_Statx),
+    ]
+    _statx.restype = ctypes.c_int
+    _probe = _Statx()
+    if _statx(AT_FDCWD, b'/', AT_STATX_DONT_SYNC, STATX_TYPE, ctypes.byref(_probe)) != 0:
+        _statx = None
+except (OSError, AttributeError):
+    _statx = None
+
+HAS_STATX = _statx is not None
+
+def statx_ifmt(path, follow_symlinks=True):
+    """
+    Return the S_IFMT type bits for path, or None if it doesn't exist.
+
+    Only valid when HAS_STATX is true; callers must use os.stat otherwise.
+    """
+    flags = AT_STATX_DONT_SYNC
+    if not follow_symlinks:
+        flags |= AT_SYMLINK_NOFOLLOW
+    buf = _Statx()
+    if _statx(AT_FDCWD, os.fsencode(path), flags, STATX_TYPE, ctypes.byref(buf)) != 0:
+        return None
+    return buf.stx_mode & S_IFMT
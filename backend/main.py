@@ -6,10 +6,16 @@ This file handles the main application setup, routes, and WebSocket connections.
 import os
 import sys
 from flask import Flask, render_template, request, jsonify
+from flask.json.provider import JSONProvider
 from flask_socketio import SocketIO, emit
 from flask_cors import CORS
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import custom modules
 from command_parser import CommandParser
 from command_executor import CommandExecutor
@@ -21,10 +27,23 @@ from security import SecurityManager
 # Load environment variables
 load_dotenv()
 
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for faster response serialization."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 # Initialize Flask app
 app = Flask(__name__, template_folder='../frontend', static_folder='../frontend/static')
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
 
+# Use orjson for JSON responses when available (falls back to stdlib json)
+if orjson is not None:
+    app.json = ORJSONProvider(app)
+
 # Enable CORS for cross-origin requests
 CORS(app)
 
@@ -52,6 +71,24 @@ def health_check():
         'message': 'Web terminal is running'
     })
 
+@app.route('/batch_interpret', methods=['POST'])
+def batch_interpret():
+    """Interpret a list of natural language inputs in batched Gemini calls."""
+    data = request.get_json(silent=True) or {}
+    inputs = data.get('inputs')
+
+    if not isinstance(inputs, list) or not all(isinstance(i, str) for i in inputs):
+        return jsonify({
+            'success': False,
+            'error': 'Request body must contain "inputs": a list of strings'
+        }), 400
+
+    results = ai_interpreter.batch_interpret(inputs)
+    return jsonify({
+        'success': True,
+        'results': [result.to_dict() for result in results]
+    })
+
 @socketio.on('connect')
 def handle_connect():
     """Handle client connection."""
@@ -71,49 +108,82 @@ def handle_disconnect():
 def handle_command(data):
     """
     Handle incoming commands from the client.
-    This is the main command processing pipeline.
+
+    Only the fast work happens on the WebSocket handler: validation and
+    parsing. Execution (including any AI round-trip) runs in a
+    background task so a slow command never stalls the socket's other
+    frames.
     """
+    # One timestamp per command; every emit below shares it. Assigned
+    # before the try so the except handler can reference it even when
+    # a malformed payload makes the first data.get raise.
+    now = system_monitor.get_current_time()
+
     try:
         user_input = data.get('command', '').strip()
         session_id = data.get('session_id', 'default')
         user_id = data.get('user_id', 'anonymous')
         client_ip = request.environ.get('REMOTE_ADDR', '127.0.0.1')
-        
+
         if not user_input:
             emit('response', {
                 'type': 'error',
                 'message': 'Empty command received',
-                'timestamp': system_monitor.get_current_time()
+                'timestamp': now
             })
             return
-        
+
         # Security validation
         validation_result = security_manager.validate_input(user_input, client_ip)
         if not validation_result['valid']:
             emit('response', {
                 'type': 'error',
                 'message': 'Security validation failed: ' + '; '.join(validation_result['errors']),
-                'timestamp': system_monitor.get_current_time()
+                'timestamp': now
             })
             return
-        
+
         # Use sanitized input
         sanitized_input = validation_result.get('sanitized_input', user_input)
-        
+
         # Parse command to determine if it's natural language or direct command
         parsed_result = command_parser.parse(sanitized_input)
-        
+
+        # Capture the socket id while the request context is live; the
+        # background task emits with it explicitly
+        sid = request.sid
+        socketio.start_background_task(
+            _execute_command, sid, user_input, sanitized_input,
+            parsed_result, user_id, session_id, now
+        )
+
+    except Exception as e:
+        emit('response', {
+            'type': 'error',
+            'message': f'Internal server error: {str(e)}',
+            'timestamp': now
+        })
+
+def _execute_command(sid, user_input, sanitized_input, parsed_result,
+                     user_id, session_id, now):
+    """
+    Execute a validated command and emit the result to its socket.
+
+    Runs as a socketio background task, outside any request context, so
+    all emits address the captured socket id explicitly.
+    """
+    try:
         # If it's natural language, use AI to interpret
         if parsed_result['type'] == 'natural_language':
             ai_result = ai_interpreter.interpret(sanitized_input)
             if ai_result['success']:
                 ai_command = ai_result['command']
-                emit('response', {
+                socketio.emit('response', {
                     'type': 'ai_interpretation',
                     'message': f"AI interpreted: {ai_command}",
-                    'timestamp': system_monitor.get_current_time()
-                })
-                
+                    'timestamp': now
+                }, to=sid)
+
                 # Check if it's a multi-command with &&
                 if '&&' in ai_command:
                     # Handle as multi-command directly - pass the full command
@@ -131,11 +201,11 @@ def handle_command(data):
                         parsed_result['type']
                     )
             else:
-                emit('response', {
+                socketio.emit('response', {
                     'type': 'error',
                     'message': f"AI interpretation failed: {ai_result['error']}",
-                    'timestamp': system_monitor.get_current_time()
-                })
+                    'timestamp': now
+                }, to=sid)
                 return
         else:
             # Execute the direct command
@@ -144,8 +214,17 @@ def handle_command(data):
                 parsed_result['args'],
                 parsed_result['type']
             )
-        
-        # Save command to database
+
+        # Send response to client first, then save history; the save
+        # only queues the row for the batched flusher
+        socketio.emit('response', {
+            'type': 'command_result',
+            'success': execution_result['success'],
+            'output': execution_result['output'],
+            'error': execution_result.get('error'),
+            'timestamp': now
+        }, to=sid)
+
         database_manager.save_command_history(
             user_id=user_id,
             session_id=session_id,
@@ -153,22 +232,13 @@ def handle_command(data):
             output=execution_result['output'],
             success=execution_result['success']
         )
-        
-        # Send response to client
-        emit('response', {
-            'type': 'command_result',
-            'success': execution_result['success'],
-            'output': execution_result['output'],
-            'error': execution_result.get('error'),
-            'timestamp': system_monitor.get_current_time()
-        })
-        
+
     except Exception as e:
-        emit('response', {
+        socketio.emit('response', {
             'type': 'error',
             'message': f'Internal server error: {str(e)}',
-            'timestamp': system_monitor.get_current_time()
-        })
+            'timestamp': now
+        }, to=sid)
 
 @socketio.on('get_system_info')
 def handle_system_info():
@@ -3,12 +3,37 @@ System Monitor Module
 Handles system monitoring and information gathering using psutil.
 """
 
+import heapq
 import psutil
 import platform
 import time
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Any
 
+# Optional: with NumPy installed the per-partition GB/percent math
+# runs as one vectorized pass instead of per-partition Python trips.
+# Only worth the ufunc dispatch once several partitions exist.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_NP_MIN_PARTITIONS = 4
+
+# Address-family enum -> display string, filled lazily; str() on an
+# enum member is surprisingly costly to repeat per address per call
+_FAMILY_STRS: Dict[Any, str] = {}
+
+# Unit table for format_bytes; index i covers magnitudes [2^(10i), 2^(10(i+1)))
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# GB conversions multiply by the reciprocal instead of dividing;
+# float multiply is cheaper than divide and the intent reads the same
+_GB = 1 << 30
+_INV_GB = 1.0 / _GB
+
 class SystemMonitor:
     """
     Monitors system resources and provides system information.
@@ -16,6 +41,52 @@ class SystemMonitor:
     
     def __init__(self):
         self.start_time = time.time()
+
+        # Handle for this process, created once; per-call
+        # psutil.Process() re-reads /proc/<pid> on construction
+        self._self_proc = psutil.Process()
+        self._self_pid = self._self_proc.pid
+
+        # Seed psutil's CPU counters so later interval=None reads
+        # return usage since the previous call instead of blocking for
+        # a sampling window. Readings taken back-to-back are noisy, so
+        # samples within _CPU_MIN_INTERVAL reuse the last values.
+        psutil.cpu_percent(interval=None)
+        psutil.cpu_percent(interval=None, percpu=True)
+        self._CPU_MIN_INTERVAL = 0.05
+        self._last_cpu_sample = time.monotonic()
+        self._last_cpu_values = None  # (overall, per_cpu)
+
+        # None of these change while the process runs, so gather them
+        # once instead of re-querying on every monitoring request
+        self._static_platform = {
+            'system': platform.system(),
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'processor': platform.processor(),
+            'python_version': platform.python_version(),
+        }
+        self._cpu_count_logical = psutil.cpu_count(logical=True)
+        self._cpu_count_physical = psutil.cpu_count(logical=False)
+        self._boot_time = psutil.boot_time()
+        self._boot_time_str = datetime.fromtimestamp(self._boot_time).strftime('%Y-%m-%d %H:%M:%S')
+
+        # Timestamp strings have one-second resolution, so the
+        # formatted value is cached per integer second; high-frequency
+        # polling then skips strftime almost every call
+        self._ts_cache_second = 0
+        self._ts_cache_value = ''
+
+        # Short-TTL cache for raw psutil snapshots shared by
+        # get_quick_stats and get_system_summary; back-to-back calls
+        # reuse one sampling pass instead of re-reading /proc
+        self._SNAPSHOT_TTL = 0.25
+        self._snapshot_cache = {}  # {key: (expiry, value)}
+
+        # Pool for get_system_info's independent collectors; psutil
+        # releases the GIL inside its syscalls, so the /proc walks
+        # genuinely overlap
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='sysmon')
     
     def get_current_time(self) -> str:
         """
@@ -24,8 +95,47 @@ class SystemMonitor:
         Returns:
             str: Current timestamp
         """
-        return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    
+        second = int(time.time())
+        if second != self._ts_cache_second:
+            # time.strftime stays in C; datetime.fromtimestamp built a
+            # full datetime object only to throw it away
+            self._ts_cache_value = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second))
+            self._ts_cache_second = second
+        return self._ts_cache_value
+
+    def _cpu_percent(self):
+        """
+        Sample CPU usage without blocking.
+
+        Returns an (overall, per_cpu) tuple measured since the previous
+        sample; calls closer together than _CPU_MIN_INTERVAL reuse the
+        last measurement rather than returning a near-zero reading.
+        """
+        now = time.monotonic()
+        if (self._last_cpu_values is not None
+                and now - self._last_cpu_sample < self._CPU_MIN_INTERVAL):
+            return self._last_cpu_values
+
+        overall = psutil.cpu_percent(interval=None)
+        per_cpu = psutil.cpu_percent(interval=None, percpu=True)
+        self._last_cpu_sample = now
+        self._last_cpu_values = (overall, per_cpu)
+        return self._last_cpu_values
+
+    def _cached_snapshot(self, key: str, fn):
+        """
+        Return fn()'s value, reusing the stored one while it is
+        younger than _SNAPSHOT_TTL. A racing refresh just samples
+        twice, which is harmless.
+        """
+        now = time.monotonic()
+        entry = self._snapshot_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        value = fn()
+        self._snapshot_cache[key] = (now + self._SNAPSHOT_TTL, value)
+        return value
+
     def get_system_info(self) -> Dict[str, Any]:
         """
         Get comprehensive system information.
@@ -34,32 +144,38 @@ class SystemMonitor:
             Dict containing system information
         """
         try:
-            # Basic system info
+            # The five heavy collectors are independent and IO-bound,
+            # so they run concurrently; platform data is precomputed
+            # and uptime is microseconds, so those stay inline
+            cpu_f = self._pool.submit(self.get_cpu_info)
+            memory_f = self._pool.submit(self.get_memory_info)
+            disk_f = self._pool.submit(self.get_disk_info)
+            network_f = self._pool.submit(self.get_network_info)
+            processes_f = self._pool.submit(self.get_process_info)
+
             system_info = {
-                'platform': {
-                    'system': platform.system(),
-                    'platform': platform.platform(),
-                    'machine': platform.machine(),
-                    'processor': platform.processor(),
-                    'python_version': platform.python_version(),
-                },
-                'cpu': self.get_cpu_info(),
-                'memory': self.get_memory_info(),
-                'disk': self.get_disk_info(),
-                'network': self.get_network_info(),
-                'processes': self.get_process_info(),
+                'platform': dict(self._static_platform),
+                'cpu': cpu_f.result(),
+                'memory': memory_f.result(),
+                'disk': disk_f.result(),
+                'network': network_f.result(),
+                'processes': processes_f.result(),
                 'uptime': self.get_uptime(),
                 'timestamp': self.get_current_time()
             }
-            
+
             return system_info
-            
+
         except Exception as e:
             return {
                 'error': f'Failed to get system info: {str(e)}',
                 'timestamp': self.get_current_time()
             }
     
+    def close(self):
+        """Shut down the collector pool; idempotent."""
+        self._pool.shutdown(wait=False)
+
     def get_cpu_info(self) -> Dict[str, Any]:
         """
         Get CPU information and usage.
@@ -68,11 +184,12 @@ class SystemMonitor:
             Dict containing CPU information
         """
         try:
+            usage_percent, usage_per_cpu = self._cpu_percent()
             cpu_info = {
-                'count_logical': psutil.cpu_count(logical=True),
-                'count_physical': psutil.cpu_count(logical=False),
-                'usage_percent': psutil.cpu_percent(interval=1),
-                'usage_per_cpu': psutil.cpu_percent(interval=1, percpu=True),
+                'count_logical': self._cpu_count_logical,
+                'count_physical': self._cpu_count_physical,
+                'usage_percent': usage_percent,
+                'usage_per_cpu': usage_per_cpu,
                 'frequency': None,
                 'load_average': None
             }
@@ -119,17 +236,17 @@ class SystemMonitor:
                     'used': virtual_mem.used,
                     'free': virtual_mem.free,
                     'percent': virtual_mem.percent,
-                    'total_gb': round(virtual_mem.total / (1024**3), 2),
-                    'used_gb': round(virtual_mem.used / (1024**3), 2),
-                    'available_gb': round(virtual_mem.available / (1024**3), 2)
+                    'total_gb': round(virtual_mem.total * _INV_GB, 2),
+                    'used_gb': round(virtual_mem.used * _INV_GB, 2),
+                    'available_gb': round(virtual_mem.available * _INV_GB, 2)
                 },
                 'swap': {
                     'total': swap_mem.total,
                     'used': swap_mem.used,
                     'free': swap_mem.free,
                     'percent': swap_mem.percent,
-                    'total_gb': round(swap_mem.total / (1024**3), 2),
-                    'used_gb': round(swap_mem.used / (1024**3), 2)
+                    'total_gb': round(swap_mem.total * _INV_GB, 2),
+                    'used_gb': round(swap_mem.used * _INV_GB, 2)
                 }
             }
             
@@ -151,27 +268,54 @@ class SystemMonitor:
                 'io_counters': None
             }
             
-            # Get disk partitions
-            partitions = psutil.disk_partitions()
-            for partition in partitions:
+            # Get disk partitions and their usage counters first; the
+            # derived math runs over the collected batch below
+            entries = []
+            for partition in psutil.disk_partitions():
                 try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    partition_info = {
-                        'device': partition.device,
-                        'mountpoint': partition.mountpoint,
-                        'fstype': partition.fstype,
-                        'total': usage.total,
-                        'used': usage.used,
-                        'free': usage.free,
-                        'percent': (usage.used / usage.total) * 100,
-                        'total_gb': round(usage.total / (1024**3), 2),
-                        'used_gb': round(usage.used / (1024**3), 2),
-                        'free_gb': round(usage.free / (1024**3), 2)
-                    }
-                    disk_info['partitions'].append(partition_info)
+                    entries.append((partition, psutil.disk_usage(partition.mountpoint)))
                 except PermissionError:
                     # Skip partitions we can't access
                     continue
+
+            if np is not None and len(entries) >= _NP_MIN_PARTITIONS:
+                # Vectorized: one ufunc pass computes every partition's
+                # percent and GB fields at once
+                totals = np.fromiter((u.total for _, u in entries), dtype=np.float64)
+                useds = np.fromiter((u.used for _, u in entries), dtype=np.float64)
+                frees = np.fromiter((u.free for _, u in entries), dtype=np.float64)
+                percents = np.divide(
+                    useds * 100.0, totals,
+                    out=np.zeros_like(useds), where=totals > 0
+                )
+                totals_gb = np.round(totals * _INV_GB, 2)
+                useds_gb = np.round(useds * _INV_GB, 2)
+                frees_gb = np.round(frees * _INV_GB, 2)
+                derived = zip(percents, totals_gb, useds_gb, frees_gb)
+            else:
+                derived = (
+                    (
+                        usage.used * (100.0 / usage.total if usage.total else 0.0),
+                        round(usage.total * _INV_GB, 2),
+                        round(usage.used * _INV_GB, 2),
+                        round(usage.free * _INV_GB, 2)
+                    )
+                    for _, usage in entries
+                )
+
+            for (partition, usage), (percent, total_gb, used_gb, free_gb) in zip(entries, derived):
+                disk_info['partitions'].append({
+                    'device': partition.device,
+                    'mountpoint': partition.mountpoint,
+                    'fstype': partition.fstype,
+                    'total': usage.total,
+                    'used': usage.used,
+                    'free': usage.free,
+                    'percent': float(percent),
+                    'total_gb': float(total_gb),
+                    'used_gb': float(used_gb),
+                    'free_gb': float(free_gb)
+                })
             
             # Get disk I/O counters
             try:
@@ -193,10 +337,16 @@ class SystemMonitor:
         except Exception as e:
             return {'error': str(e)}
     
-    def get_network_info(self) -> Dict[str, Any]:
+    def get_network_info(self, include_connections: bool = False) -> Dict[str, Any]:
         """
         Get network information and statistics.
-        
+
+        Args:
+            include_connections (bool): Also count open connections.
+                Off by default — net_connections is one of psutil's
+                most expensive calls and the count was the only thing
+                kept from it.
+
         Returns:
             Dict containing network information
         """
@@ -215,8 +365,12 @@ class SystemMonitor:
                 }
                 
                 for addr in addresses:
+                    family = addr.family
+                    family_str = _FAMILY_STRS.get(family)
+                    if family_str is None:
+                        family_str = _FAMILY_STRS.setdefault(family, str(family))
                     addr_info = {
-                        'family': str(addr.family),
+                        'family': family_str,
                         'address': addr.address,
                         'netmask': addr.netmask,
                         'broadcast': addr.broadcast
@@ -242,60 +396,93 @@ class SystemMonitor:
             except:
                 pass
             
-            # Get connection count
-            try:
-                connections = psutil.net_connections()
-                network_info['connections'] = len(connections)
-            except:
-                pass
+            # Get connection count (opt-in; walks /proc/net in full)
+            if include_connections:
+                try:
+                    connections = psutil.net_connections(kind='inet')
+                    network_info['connections'] = len(connections)
+                except:
+                    pass
             
             return network_info
             
         except Exception as e:
             return {'error': str(e)}
     
-    def get_process_info(self) -> Dict[str, Any]:
+    def get_process_info(self, top_n: int = 10, scan_limit: int = None) -> Dict[str, Any]:
         """
         Get process information.
-        
+
+        Args:
+            top_n (int): How many top-CPU processes to report; pass 0
+                to skip the per-process attribute walk entirely and
+                return only the count and current-process stats
+            scan_limit (int): Cap the attribute walk at this many
+                processes. The total count is exact either way (it
+                comes from psutil.pids()); the top list is then best
+                within the scanned prefix, trading completeness for a
+                bounded number of /proc reads on busy hosts
+
         Returns:
             Dict containing process information
         """
         try:
-            processes = []
-            total_processes = 0
-            
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
-                try:
-                    proc_info = proc.info
-                    total_processes += 1
-                    
-                    # Only include top processes to avoid overwhelming output
-                    if len(processes) < 10:
-                        processes.append({
-                            'pid': proc_info['pid'],
-                            'name': proc_info['name'],
-                            'cpu_percent': proc_info['cpu_percent'],
-                            'memory_percent': round(proc_info['memory_percent'], 2)
-                        })
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
-            
-            # Sort by CPU usage
-            processes.sort(key=lambda x: x['cpu_percent'] or 0, reverse=True)
-            
+            # One syscall covers the total; counting inside the
+            # attribute walk was redundant
+            total_processes = len(psutil.pids())
+
+            # A bounded min-heap keeps the true top-N by CPU while the
+            # iterator streams past (the old code kept the first ten
+            # processes encountered, which was arbitrary)
+            top_processes = []
+            if top_n > 0:
+                proc_iter = psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent'])
+                if scan_limit is not None:
+                    proc_iter = islice(proc_iter, scan_limit)
+                heap = []  # (cpu_percent, pid, name, memory_percent)
+                for proc in proc_iter:
+                    try:
+                        proc_info = proc.info
+                        entry = (
+                            proc_info['cpu_percent'] or 0.0,
+                            proc_info['pid'],
+                            proc_info['name'],
+                            proc_info['memory_percent'] or 0.0
+                        )
+                        if len(heap) < top_n:
+                            heapq.heappush(heap, entry)
+                        elif entry > heap[0]:
+                            heapq.heapreplace(heap, entry)
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        pass
+
+                top_processes = [
+                    {
+                        'pid': pid,
+                        'name': name,
+                        'cpu_percent': cpu_percent,
+                        'memory_percent': round(memory_percent, 2)
+                    }
+                    for cpu_percent, pid, name, memory_percent in sorted(heap, reverse=True)
+                ]
+
+            # oneshot() coalesces the /proc reads behind these calls
+            # into one pass instead of one per attribute
+            with self._self_proc.oneshot():
+                current_process = {
+                    'pid': self._self_pid,
+                    'cpu_percent': self._self_proc.cpu_percent(),
+                    'memory_percent': self._self_proc.memory_percent()
+                }
+
             process_info = {
                 'total_count': total_processes,
-                'top_processes': processes[:10],
-                'current_process': {
-                    'pid': psutil.Process().pid,
-                    'cpu_percent': psutil.Process().cpu_percent(),
-                    'memory_percent': psutil.Process().memory_percent()
-                }
+                'top_processes': top_processes,
+                'current_process': current_process
             }
-            
+
             return process_info
-            
+
         except Exception as e:
             return {'error': str(e)}
     
@@ -307,9 +494,7 @@ class SystemMonitor:
             Dict containing uptime information
         """
         try:
-            boot_time = psutil.boot_time()
-            current_time = time.time()
-            uptime_seconds = current_time - boot_time
+            uptime_seconds = time.time() - self._boot_time
             
             # Calculate uptime components
             days = int(uptime_seconds // (24 * 3600))
@@ -318,7 +503,7 @@ class SystemMonitor:
             seconds = int(uptime_seconds % 60)
             
             uptime_info = {
-                'boot_time': datetime.fromtimestamp(boot_time).strftime('%Y-%m-%d %H:%M:%S'),
+                'boot_time': self._boot_time_str,
                 'uptime_seconds': uptime_seconds,
                 'uptime_formatted': f"{days}d {hours}h {minutes}m {seconds}s",
                 'days': days,
@@ -341,10 +526,10 @@ class SystemMonitor:
         """
         try:
             stats = {
-                'cpu_percent': psutil.cpu_percent(interval=0.1),
-                'memory_percent': psutil.virtual_memory().percent,
-                'disk_percent': psutil.disk_usage('/').percent,
-                'process_count': len(psutil.pids()),
+                'cpu_percent': self._cpu_percent()[0],
+                'memory_percent': self._cached_snapshot('virtual_memory', psutil.virtual_memory).percent,
+                'disk_percent': self._cached_snapshot('disk_root', lambda: psutil.disk_usage('/')).percent,
+                'process_count': len(self._cached_snapshot('pids', psutil.pids)),
                 'timestamp': self.get_current_time()
             }
             
@@ -363,11 +548,12 @@ class SystemMonitor:
         Returns:
             str: Formatted string
         """
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_value < 1024.0:
-                return f"{bytes_value:.1f} {unit}"
-            bytes_value /= 1024.0
-        return f"{bytes_value:.1f} PB"
+        # bit_length picks the unit directly (each unit spans 10 bits),
+        # so one shift and one divide replace the division loop
+        if bytes_value <= 0:
+            return '0.0 B'
+        index = min((int(bytes_value).bit_length() - 1) // 10, len(_UNITS) - 1)
+        return f"{bytes_value / (1 << (index * 10)):.1f} {_UNITS[index]}"
     
     def get_system_summary(self) -> str:
         """
@@ -377,15 +563,15 @@ class SystemMonitor:
             str: Formatted system summary
         """
         try:
-            cpu_percent = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            cpu_percent = self._cpu_percent()[0]
+            memory = self._cached_snapshot('virtual_memory', psutil.virtual_memory)
+            disk = self._cached_snapshot('disk_root', lambda: psutil.disk_usage('/'))
             
             summary = f"""System Summary ({self.get_current_time()}):
 CPU Usage: {cpu_percent}%
 Memory: {memory.percent}% used ({self.format_bytes(memory.used)} / {self.format_bytes(memory.total)})
 Disk: {(disk.used / disk.total * 100):.1f}% used ({self.format_bytes(disk.used)} / {self.format_bytes(disk.total)})
-Processes: {len(psutil.pids())}
+Processes: {len(self._cached_snapshot('pids', psutil.pids))}
 Uptime: {self.get_uptime()['uptime_formatted']}"""
             
             return summary
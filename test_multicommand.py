@@ -70,12 +70,17 @@ def test_multi_command():
             print("\n🔍 Step 4: Verifying results...")
             ls_result = command_executor.execute('ls', [], 'terminal_command')
             print(f"   Files: {ls_result['output']}")
-            
-            if 'test1' in ls_result['output']:
+
+            # Split the listing once and test exact names; substring
+            # probes scan the whole output and would also match e.g.
+            # a leftover 'test10'
+            files = set(ls_result['output'].split())
+            if 'test1' in files:
                 ls_test1 = command_executor.execute('ls', ['test1'], 'terminal_command')
                 print(f"   Files in test1: {ls_test1['output']}")
-                
-                if 'file1.txt' in ls_test1['output']:
+
+                test1_files = set(ls_test1['output'].split())
+                if 'file1.txt' in test1_files:
                     print("   ✅ SUCCESS: file1.txt moved to test1/")
                 else:
                     print("   ❌ FAILED: file1.txt not found in test1/")
@@ -23,37 +23,51 @@ class WebTerminalIntegrationTest:
     def __init__(self):
         self.backend_process = None
         self.base_url = 'http://localhost:5000'
-        
+        self.session = None
+
     def setup(self):
         """Set up the test environment."""
         print("Setting up integration tests...")
-        
+
+        # One session for every HTTP probe and test; keep-alive reuses
+        # a single socket instead of a TCP handshake per request, and
+        # the small pool keeps startup-probe retries on that socket too
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1)
+        self.session.mount('http://', adapter)
+
+
         # Start the backend server
         backend_script = backend_dir / 'main.py'
         self.backend_process = subprocess.Popen([
             sys.executable, str(backend_script)
         ], cwd=str(backend_dir))
         
-        # Wait for server to start
+        # Wait for server to start: probe immediately and back off
+        # from 50ms up to 500ms within a 10s deadline, so a server
+        # ready in hundreds of ms is detected in hundreds of ms
+        # instead of after a fixed 5-second sleep
         print("Waiting for server to start...")
-        time.sleep(5)
-        
-        # Check if server is running
-        for attempt in range(10):
+        deadline = time.monotonic() + 10
+        delay = 0.05
+        while time.monotonic() < deadline:
             try:
-                response = requests.get(f'{self.base_url}/health', timeout=2)
+                response = self.session.get(f'{self.base_url}/health', timeout=0.5)
                 if response.status_code == 200:
                     print("✅ Server is running")
                     return True
             except requests.exceptions.RequestException:
                 pass
-            time.sleep(1)
-        
+            time.sleep(delay)
+            delay = min(delay * 1.5, 0.5)
+
         print("❌ Failed to start server")
         return False
     
     def teardown(self):
         """Clean up the test environment."""
+        if self.session:
+            self.session.close()
         if self.backend_process:
             self.backend_process.terminate()
             self.backend_process.wait()
@@ -63,7 +77,7 @@ class WebTerminalIntegrationTest:
         """Test the health check endpoint."""
         print("\n🧪 Testing health endpoint...")
         try:
-            response = requests.get(f'{self.base_url}/health')
+            response = self.session.get(f'{self.base_url}/health')
             assert response.status_code == 200
             data = response.json()
             assert data['status'] == 'healthy'
@@ -77,7 +91,7 @@ class WebTerminalIntegrationTest:
         """Test that the frontend loads correctly."""
         print("\n🧪 Testing frontend loading...")
         try:
-            response = requests.get(self.base_url)
+            response = self.session.get(self.base_url)
             assert response.status_code == 200
             assert 'Web Terminal' in response.text
             assert 'terminal.js' in response.text
@@ -92,12 +106,12 @@ class WebTerminalIntegrationTest:
         print("\n🧪 Testing static files...")
         try:
             # Test CSS
-            css_response = requests.get(f'{self.base_url}/static/style.css')
+            css_response = self.session.get(f'{self.base_url}/static/style.css')
             assert css_response.status_code == 200
             assert 'terminal-container' in css_response.text
             
             # Test JS
-            js_response = requests.get(f'{self.base_url}/static/terminal.js')
+            js_response = self.session.get(f'{self.base_url}/static/terminal.js')
             assert js_response.status_code == 200
             assert 'WebTerminal' in js_response.text
             